@@ -1,6 +1,5 @@
 import argparse
 import os
-import sys
 
 from core.combine_clusters_devices import combine_clusters_devices
 from core.xml_parser import generate_json
@@ -8,42 +7,50 @@ from utils.file_utils import create_output_directory
 from utils.file_utils import validate_input_paths
 from utils.logger import setup_logger
 
-# Add the data_model directory to Python path so we can import from subdirectories
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 logger = setup_logger()
 
 
 def get_element_requirements(chip_path,
                              chip_version_dir,
                              output_dir,
-                             chip_commit_hash=None):
+                             chip_commit_hash=None,
+                             keep_intermediate=True,
+                             cluster_hierarchy_hints=None):
     """Get the element requirements for the given chip path and chip version.
 
     :param chip_path:
     :param chip_version_dir:
     :param output_dir:
     :param chip_commit_hash:  (Default value = None)
+    :param keep_intermediate: Write the intermediate clusters.json and device_types.json files.  (Default value = True)
+    :param cluster_hierarchy_hints: List of regex patterns of derived cluster file names, the built-in hints if None.  (Default value = None)
 
     """
     generated_output_dir = os.path.join(output_dir, "generated")
-    if not create_output_directory(generated_output_dir):
+    if keep_intermediate and not create_output_directory(
+            generated_output_dir):
         return
 
     logger.info(
         f"Generating JSON files for {chip_path} and {chip_version_dir} in {generated_output_dir}"
     )
-    generate_json(chip_path, chip_version_dir, generated_output_dir)
-    logger.info(f"Generated JSON files in {generated_output_dir}")
+    generated = generate_json(chip_path, chip_version_dir,
+                              generated_output_dir, keep_intermediate,
+                              cluster_hierarchy_hints)
+    if generated is None:
+        logger.error("Failed to generate JSON files")
+        return
+    # Nothing is written to the generated directory when the intermediate files are skipped
+    if keep_intermediate:
+        logger.info(f"Generated JSON files in {generated_output_dir}")
 
-    clusters_json_file = os.path.join(generated_output_dir, "clusters.json")
-    device_types_json_file = os.path.join(generated_output_dir,
-                                          "device_types.json")
+    # The generated lists are combined directly instead of reading the intermediate files back
+    clusters_list, devices_list = generated
     element_requirements_json_file = os.path.join(
         output_dir,
         f"element_requirements_{chip_version_dir}{'_' + chip_commit_hash if chip_commit_hash else ''}.json",
     )
-    combine_clusters_devices(clusters_json_file, device_types_json_file,
+    combine_clusters_devices(clusters_list, devices_list,
                              element_requirements_json_file)
 
 
@@ -100,6 +107,22 @@ def main():
         required=False,
         help="Chip commit hash to process.",
     )
+    parser.add_argument(
+        "--skip-intermediate",
+        action="store_true",
+        help=
+        "Do not write the intermediate clusters.json and device_types.json files.",
+    )
+    parser.add_argument(
+        "--cluster-hierarchy-hint",
+        type=str,
+        action="append",
+        dest="cluster_hierarchy_hints",
+        metavar="REGEX",
+        help=
+        "Regex of derived cluster file names without extension, matching files are not read to find their hierarchy. "
+        "Can be given multiple times and replaces the built-in hints.",
+    )
     args = parser.parse_args()
 
     if not __validate_input_files(args.chip_path, args.chip_version_dir,
@@ -108,7 +131,9 @@ def main():
         return
 
     get_element_requirements(args.chip_path, args.chip_version_dir,
-                             args.output_dir, args.chip_commit_hash)
+                             args.output_dir, args.chip_commit_hash,
+                             not args.skip_intermediate,
+                             args.cluster_hierarchy_hints)
 
 
 if __name__ == "__main__":
@@ -7,12 +7,13 @@ cluster information in device_types.json, creating a comprehensive view of each
 with all cluster attributes, commands, events, and features.
 """
 import argparse
-import os
-import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Tuple
+from typing import Union
 
 from utils.file_utils import load_json_file
 from utils.file_utils import validate_file_path
@@ -21,37 +22,92 @@ from utils.helper import convert_to_snake_case
 from utils.helper import esp_name
 from utils.logger import setup_logger
 
-# Add parent directory to Python path so we can import utils
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 logger = setup_logger()
 
-def merge_items(device_items, cluster_items, merged_cluster, key="commands"):
+def merge_items(device_items, item_index):
     """
-    Merge cluster items (commands/attributes) with device overrides.
+    Merge cluster items (commands/attributes/events) with device overrides.
     Keeps mandatory ones and those explicitly listed in device.
+    Returns the merged items sorted by ID (hex) then name.
     """
-    items_by_name = {item["name"]: dict(item) for item in cluster_items}
+    items_by_name, mandatory_items = item_index
 
     # Select mandatory + explicitly included items
-    required = {}
+    required = dict(mandatory_items)
+    for name in device_items:
+        if name in items_by_name:
+            required[name] = items_by_name[name]
+
+    # Sort keys are unique as they contain the item name, so the items themselves are never compared
+    return [item.copy() for _, item in sorted(required.values())]
+
+
+def get_item_sort_key(item):
+    """Get the key to sort cluster items by ID (hex) then name.
+
+    :param item: Item of the full cluster definition.
+
+    """
+    return (int(item.get("id", "0"), 16), item.get("name", ""))
+
+
+def create_item_index(cluster_items):
+    """Index cluster items (commands/attributes/events) by name and collect the mandatory ones.
+    Every item is stored once without the "mandatory" key, along with its precomputed sort key.
+
+    :param cluster_items: List of items of the full cluster definition.
+    :returns: Tuple of (items by name, mandatory items by name), both mapping to (sort key, item)
+
+    """
+    items_by_name = {}
+    mandatory_items = {}
     for item in cluster_items:
+        entry = (get_item_sort_key(item), {
+            key: value
+            for key, value in item.items() if key != "mandatory"
+        })
+        items_by_name[item["name"]] = entry
         if item.get("mandatory"):
-            required[item["name"]] = dict(item)
+            mandatory_items[item["name"]] = entry
+    return items_by_name, mandatory_items
 
-    for name in device_items:
-        if name in items_by_name:
-            required[name] = dict(items_by_name[name])
 
-    # Remove "mandatory" key if present
-    for item in required.values():
-        item.pop("mandatory", None)
+def create_cluster_index(cluster: Dict[str, Any]) -> Dict[str, Any]:
+    """Create the name lookups of a full cluster definition used while merging device clusters.
+    The index only depends on the full cluster, so it is built once and shared by all the devices using the cluster.
+
+    :param cluster: Dict[str:
+    :param Any]:
+
+    """
+    features = []
+    for feature in cluster.get("features", []):
+        feature_name = feature.get("name", "")
+        feature_code = feature.get("code", "")
+        # Normalized names under which a device can reference the feature
+        features.append((feature, (feature_name.lower(), feature_code.lower(),
+                                   convert_to_snake_case(feature_name))))
+    features.sort(key=lambda x: get_item_sort_key(x[0]))
+
+    return {
+        "features": features,
+        "commands": create_item_index(cluster.get("commands", [])),
+        "attributes": create_item_index(cluster.get("attributes", [])),
+        "events": create_item_index(cluster.get("events", [])),
+    }
+
+
+@lru_cache(maxsize=4096)
+def normalize_feature_name(feature_name: str) -> Tuple[str, str, str]:
+    """Get the normalized names under which a device feature can match a cluster feature.
+    The result is cached as the same feature names are used by many device types.
+
+    :param feature_name: str:
+
+    """
+    return (feature_name.lower(), esp_name(feature_name),
+            convert_to_snake_case(feature_name))
 
-    # Sort by ID (hex) then name
-    merged_cluster[key] = sorted(
-        required.values(),
-        key=lambda x: (int(x.get("id", "0"), 16), x.get("name", ""))
-    )
 
 def create_cluster_lookup(
         clusters: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
@@ -98,7 +154,8 @@ def convert_feature_name_to_code(
 
 def merge_device_cluster_with_full_definition(
         device_cluster: Dict[str, Any],
-        full_cluster: Dict[str, Any]) -> Dict[str, Any]:
+        full_cluster: Dict[str, Any],
+        cluster_index: Dict[str, Any] = None) -> Dict[str, Any]:
     """Merge device-specific cluster info with full cluster definition.
 
     :param device_cluster: Dict[str:
@@ -106,72 +163,75 @@ def merge_device_cluster_with_full_definition(
     :param device_cluster: Dict[str:
     :param Any]:
     :param full_cluster: Dict[str:
+    :param cluster_index: Index of the full cluster created by create_cluster_index.  (Default value = None)
 
     """
-    merged_cluster = full_cluster.copy()
-
-    # Override with device-specific information
-    merged_cluster["type"] = device_cluster.get("type", "server")
-    merged_cluster["required"] = device_cluster.get("required", False)
-
-    # Handle features - include ALL features from full cluster
-    device_features = device_cluster.get("features", [])
-    full_features = full_cluster.get("features", [])
+    if cluster_index is None:
+        cluster_index = create_cluster_index(full_cluster)
 
     # Create a set of device feature names for quick lookup (converted to snake_case)
     device_feature_names = set()
-    for feature_name in device_features:
-        device_feature_names.add(feature_name.lower())
-        device_feature_names.add(esp_name(feature_name).lower())
-        device_feature_names.add(convert_to_snake_case(feature_name).lower())
-
-    # Include ALL features from the full cluster
-    enhanced_features = []
-    for feature in full_features:
-        feature_copy = feature.copy()
-        feature_name = feature.get("name", "")
-        feature_code = feature.get("code", "")
-
-        # Check if this feature is required by the device
-        is_required = (feature_name.lower() in device_feature_names
-                       or feature_code.lower() in device_feature_names
-                       or convert_to_snake_case(feature_name).lower()
-                       in device_feature_names)
-
-        # Set the required flag based on device specification
-        feature_copy["required"] = is_required
-        enhanced_features.append(feature_copy)
-
-    enhanced_features.sort(key=lambda x: (int(x.get("id", "0"), 16), x.get("name", "")))
-    merged_cluster["features"] = enhanced_features
+    for feature_name in device_cluster.get("features", []):
+        device_feature_names.update(normalize_feature_name(feature_name))
 
-    merge_items(device_cluster.get("commands", []), full_cluster.get("commands", []), merged_cluster, "commands")
-    merge_items(device_cluster.get("attributes", []), full_cluster.get("attributes", []), merged_cluster, "attributes")
-    merge_items(device_cluster.get("events", []), full_cluster.get("events", []), merged_cluster, "events")
+    # Include ALL features from the full cluster, with the required flag set based on device specification
+    enhanced_features = [{
+        **feature, "required":
+        not device_feature_names.isdisjoint(feature_keys)
+    } for feature, feature_keys in cluster_index["features"]]
 
-    return merged_cluster
-
-
-def combine_clusters_and_devices(clusters_file: str,
-                                 device_types_file: str) -> Dict[str, Any]:
+    # Override with device-specific information
+    return {
+        **full_cluster,
+        "type":
+        device_cluster.get("type", "server"),
+        "required":
+        device_cluster.get("required", False),
+        "features":
+        enhanced_features,
+        "commands":
+        merge_items(device_cluster.get("commands", []),
+                    cluster_index["commands"]),
+        "attributes":
+        merge_items(device_cluster.get("attributes", []),
+                    cluster_index["attributes"]),
+        "events":
+        merge_items(device_cluster.get("events", []), cluster_index["events"]),
+    }
+
+
+def combine_clusters_and_devices(
+        clusters_file: Union[str, List[Dict[str, Any]]],
+        device_types_file: Union[str, List[Dict[str, Any]]]
+) -> Dict[str, Any]:
     """Combine clusters.json and device_types.json into enriched device definitions.
+    The clusters and device types can also be given as already loaded lists, which skips reading the JSON files.
 
     :param clusters_file: str:
     :param device_types_file: str:
-    :param clusters_file: str:
-    :param device_types_file: str:
+    :param clusters_file: Union[str:
+    :param List[Dict[str:
+    :param Any]]]:
+    :param device_types_file: Union[str:
 
     """
 
     # Load the JSON files
-    clusters_data = load_json_file(clusters_file)
-    device_types_data = load_json_file(device_types_file)
+    clusters_data = (load_json_file(clusters_file) if isinstance(
+        clusters_file, str) else clusters_file)
+    device_types_data = (load_json_file(device_types_file) if isinstance(
+        device_types_file, str) else device_types_file)
 
     if not clusters_data or not device_types_data:
         return {}
 
     # Create cluster lookup dictionary
     cluster_lookup = create_cluster_lookup(clusters_data)
+    # Name lookups of every cluster, shared by all the devices using the cluster
+    cluster_index = {
+        cluster_id: create_cluster_index(cluster)
+        for cluster_id, cluster in cluster_lookup.items()
+    }
 
     # Process each device type
     enriched_devices = []
@@ -187,7 +247,7 @@ def combine_clusters_and_devices(clusters_file: str,
                 # Merge device cluster with full cluster definition
                 full_cluster = cluster_lookup[cluster_id]
                 merged_cluster = merge_device_cluster_with_full_definition(
-                    device_cluster, full_cluster)
+                    device_cluster, full_cluster, cluster_index[cluster_id])
                 enriched_clusters.append(merged_cluster)
             else:
                 # If cluster not found in lookup, keep original device cluster
@@ -202,9 +262,13 @@ def combine_clusters_and_devices(clusters_file: str,
     return enriched_devices
 
 
-def combine_clusters_devices(clusters_file: str, device_types_file: str,
+def combine_clusters_devices(clusters_file: Union[str, List[Dict[str,
+                                                                  Any]]],
+                             device_types_file: Union[str, List[Dict[str,
+                                                                     Any]]],
                              output_file: str):
     """Combine clusters.json and device_types.json to create enriched device definitions.
+    The clusters and device types can be paths to the JSON files or the already loaded lists.
 
     :param clusters_file: str:
     :param device_types_file: str:
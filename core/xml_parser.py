@@ -12,73 +12,152 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import argparse
+import mmap
 import os
-import sys
-import xml.etree.ElementTree as ET
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from operator import attrgetter
+
+from lxml import etree as ET
 
 from source_parser.cluster_parser import ClusterParser
 from source_parser.device_parser import DeviceParser
 from utils.file_utils import create_output_directory
 from utils.file_utils import get_file_list_by_extension
-from utils.file_utils import list_directory
 from utils.file_utils import validate_directory_path
 from utils.file_utils import write_to_json_file
 from utils.logger import setup_logger
-
-# Add parent directory to path so we can import from parent modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-# Also add the data_model directory itself for local imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from utils.mapping import cluster_hierarchy_hints
 
 logger = setup_logger()
 
+# Base cluster objects available to the worker processes parsing derived cluster files, set by _init_derived_cluster_worker
+_worker_base_clusters = None
+
+
+# Opening classification tag of a cluster file and its hierarchy attribute
+CLASSIFICATION_TAG_PATTERN = re.compile(rb"<classification\b([^>]*)>")
+HIERARCHY_ATTRIBUTE_PATTERN = re.compile(rb"""\shierarchy\s*=\s*(["'])(.*?)\1""")
+
+
+def find_cluster_hierarchy(file_path):
+    """Find the classification hierarchy of a cluster XML file with a plain byte search, without parsing the XML.
+
+    :param file_path: Path to the cluster XML file.
+    :returns: The hierarchy of the cluster, None if it could not be found this way.
 
-def get_base_and_derived_cluster_files(input_dir):
+    """
+    with open(file_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return None
+        with mm:
+            tag_match = CLASSIFICATION_TAG_PATTERN.search(mm)
+            if tag_match is None:
+                return None
+            # A classification tag inside a comment is not the real one
+            if mm.rfind(b"<!--", 0, tag_match.start()) > mm.rfind(
+                    b"-->", 0, tag_match.start()):
+                return None
+            hierarchy_match = HIERARCHY_ATTRIBUTE_PATTERN.search(
+                tag_match.group(1))
+            if hierarchy_match is None:
+                return None
+            return hierarchy_match.group(2).decode("utf-8")
+
+
+def get_cluster_hierarchy(file_path):
+    """Get the classification hierarchy of a cluster XML file e.g. base or derived.
+    The hierarchy is first looked up with a byte search, and only if that fails the file is streamed
+    and parsing stops at the classification element, so the rest of the file is never read.
+
+    :param file_path: Path to the cluster XML file.
+    :returns: The hierarchy of the cluster, None if the cluster has no classification.
+
+    """
+    hierarchy = find_cluster_hierarchy(file_path)
+    if hierarchy is not None:
+        return hierarchy
+
+    with open(file_path, "rb") as f:
+        for _, elem in ET.iterparse(f,
+                                    events=("start", ),
+                                    tag="classification",
+                                    remove_comments=True,
+                                    collect_ids=False,
+                                    huge_tree=True,
+                                    resolve_entities=False):
+            parent = elem.getparent()
+            # Only the classification of the cluster itself (child of the root element) is relevant
+            if parent is not None and parent.getparent() is None:
+                return elem.get("hierarchy")
+    return None
+
+
+def get_base_and_derived_cluster_files(input_dir, hierarchy_hints=None):
     """Get all base and derived cluster files from the input directory.
+    Files whose name matches one of the hierarchy hints are classified as derived without being read.
 
     :param input_dir: returns: A list of base and derived cluster files.
+    :param hierarchy_hints: List of regex patterns of derived cluster file names without extension,
+                            cluster_hierarchy_hints from utils.mapping if None.  (Default value = None)
     :returns: A list of base and derived cluster files.
 
     """
     base_cluster_files = []
     derived_cluster_files = []
 
-    file_list = list_directory(input_dir)
-    if file_list is None:
-        return [], []
-
-    for file_name in file_list:
-        if file_name.endswith(".xml"):
-            file_path = os.path.join(input_dir, file_name)
-            try:
-                tree = ET.parse(file_path)
-                root = tree.getroot()
-                classification = root.find("classification")
-                if classification is not None and classification.get(
-                        "hierarchy") == "derived":
-                    derived_cluster_files.append(file_path)
-                else:
-                    base_cluster_files.append(file_path)
-            except ET.ParseError as e:
-                logger.error(f"XML parsing error in {file_path}: {str(e)}")
-                continue
-            except FileNotFoundError:
-                logger.error(f"Cluster file not found: {file_path}")
-                continue
-            except PermissionError:
-                logger.error(
-                    f"Permission denied accessing cluster file: {file_path}")
-                continue
-        else:
-            logger.error(f"Skipping {file_name} as it is not a valid file")
+    if hierarchy_hints is None:
+        hierarchy_hints = cluster_hierarchy_hints
+    derived_file_pattern = (re.compile("|".join(
+        f"(?:{hint})" for hint in hierarchy_hints)) if hierarchy_hints else None)
+
+    for file_path in get_file_list_by_extension(input_dir, ".xml"):
+        file_stem = os.path.splitext(os.path.basename(file_path))[0]
+        if derived_file_pattern is not None and derived_file_pattern.search(
+                file_stem):
+            logger.debug(
+                f"Classified {file_path} as derived cluster file by its name")
+            derived_cluster_files.append(file_path)
+            continue
+        try:
+            if get_cluster_hierarchy(file_path) == "derived":
+                derived_cluster_files.append(file_path)
+            else:
+                base_cluster_files.append(file_path)
+        except ET.ParseError as e:
+            logger.error(f"XML parsing error in {file_path}: {str(e)}")
+            continue
+        except FileNotFoundError:
+            logger.error(f"Cluster file not found: {file_path}")
+            continue
+        except PermissionError:
+            logger.error(
+                f"Permission denied accessing cluster file: {file_path}")
             continue
     return base_cluster_files, derived_cluster_files
 
 
+def sort_by_id(items):
+    """Sort parsed objects by their hex id.
+    The sort is stable, so equal ids keep the order of the iterable.
+
+    :param items: Iterable of parsed elements.
+    :returns: New list of the objects sorted by id.
+
+    """
+    return sorted(items, key=attrgetter("id_int"))
+
+
 def process_cluster_files(
     input_dir,
     cluster_json_file,
     yaml_file_path,
+    hierarchy_hints=None,
 ):
     """Process all cluster XML files from input directory and generate intermediate cluster json file.
     This function is used to process all cluster XML files from input directory and generate intermediate cluster json file.
@@ -86,14 +165,15 @@ def process_cluster_files(
     Then it generates derived cluster objects.
 
     :param input_dir: Path to the directory containing the cluster XML files.
-    :param cluster_json_file: Path to the file where the cluster JSON will be written.
+    :param cluster_json_file: Path to the file where the cluster JSON will be written, nothing is written if None.
     :param yaml_file_path: Path to the YAML file containing the configuration data.
-    :returns: None
+    :param hierarchy_hints: List of regex patterns of derived cluster file names, see get_base_and_derived_cluster_files.  (Default value = None)
+    :returns: List of cluster dictionaries sorted by id, None if processing failed.
 
     """
     # Stores list of base and derived cluster XML files to be processed
     base_cluster_xml_files, derived_cluster_xml_files = get_base_and_derived_cluster_files(
-        input_dir)
+        input_dir, hierarchy_hints)
     if len(base_cluster_xml_files) == 0 and len(
             derived_cluster_xml_files) == 0:
         logger.error(f"No cluster XML files found in {input_dir}")
@@ -105,54 +185,54 @@ def process_cluster_files(
     derived_clusters = []
 
     # Process base cluster files
-    for file_path in base_cluster_xml_files:
-        cluster_list = cluster_parser.parse_cluster_file(
-            file_path=file_path,
-            yaml_file_path=yaml_file_path,
-        )
-
+    results = parse_files_in_parallel(
+        partial(parse_single_cluster_file,
+                cluster_parser,
+                yaml_file_path=yaml_file_path),
+        base_cluster_xml_files,
+    )
+    for file_path, cluster_list in zip(base_cluster_xml_files, results):
         if cluster_list is None or len(cluster_list) == 0:
-            logger.error(
-                f"********************** Processing of {os.path.basename(file_path)} failed************************"
-            )
+            logger.error("Processing of %s failed",
+                         os.path.basename(file_path))
             continue
 
         base_clusters.extend(cluster_list)
-        logger.info(
-            f"********************** Processing of {os.path.basename(file_path)} completed************************"
-        )
-
-    # Process derived cluster files
-    for file_path in derived_cluster_xml_files:
-        cluster_list = cluster_parser.parse_cluster_file(
-            file_path=file_path,
-            yaml_file_path=yaml_file_path,
-            base_clusters=base_clusters,
-        )
-
+        logger.debug("Processing of %s completed",
+                     os.path.basename(file_path))
+
+    # Process derived cluster files, every worker receives the base clusters once through the pool initializer
+    results = parse_files_in_parallel(
+        partial(parse_single_derived_cluster_file,
+                cluster_parser,
+                yaml_file_path=yaml_file_path),
+        derived_cluster_xml_files,
+        initializer=_init_derived_cluster_worker,
+        initargs=(base_clusters, ),
+    )
+    for file_path, cluster_list in zip(derived_cluster_xml_files, results):
         if cluster_list is None or len(cluster_list) == 0:
-            logger.error(
-                f"********************** Processing of {os.path.basename(file_path)} failed************************"
-            )
+            logger.error("Processing of %s failed",
+                         os.path.basename(file_path))
             continue
 
         derived_clusters.extend(cluster_list)
-        logger.info(
-            f"********************** Processing of {os.path.basename(file_path)} completed************************"
-        )
+        logger.debug("Processing of %s completed",
+                     os.path.basename(file_path))
 
-    clusters = base_clusters + derived_clusters
     # Convert clusters to list of dictionaries
-    clusters_list = [cluster.to_dict() for cluster in clusters]
-    clusters_list.sort(key=lambda x: int(x.get("id"), 16))
-
-    if not write_to_json_file(cluster_json_file, clusters_list):
-        logger.error(f"Failed to write to {cluster_json_file}")
-        return
+    clusters_list = [
+        cluster.to_dict()
+        for cluster in sort_by_id(chain(base_clusters, derived_clusters))
+    ]
 
-    logger.info(
-        f"\n\n--------------------------------------------------PROCESSING COMPLETE | GENERATED cluster json in {cluster_json_file}--------------------------------------------------\n\n"
-    )
+    if cluster_json_file is not None:
+        if not write_to_json_file(cluster_json_file, clusters_list):
+            logger.error(f"Failed to write to {cluster_json_file}")
+            return
+        logger.info("Processing complete, generated cluster json in %s",
+                    cluster_json_file)
+    return clusters_list
 
 
 def parse_single_device_file(device_parser, file_path):
@@ -168,6 +248,7 @@ def parse_single_device_file(device_parser, file_path):
 
 def parse_single_cluster_file(cluster_parser, file_path, yaml_file_path):
     """Parse a single cluster XML file and return the parsed cluster object.
+    Only the YAML file path is sent with the task, every worker process loads the file once through get_yaml_parser.
 
     :param cluster_parser: Instance of ClusterParser.
     :param file_path: Path to the cluster XML file.
@@ -178,56 +259,106 @@ def parse_single_cluster_file(cluster_parser, file_path, yaml_file_path):
     return cluster_parser.parse_cluster_file(file_path, yaml_file_path)
 
 
+def _init_derived_cluster_worker(base_clusters):
+    """Store the base cluster objects in the worker process so they are not sent along with every derived cluster file.
+
+    :param base_clusters: List of base cluster objects.
+
+    """
+    global _worker_base_clusters
+    _worker_base_clusters = base_clusters
+
+
+def parse_single_derived_cluster_file(cluster_parser, file_path,
+                                      yaml_file_path):
+    """Parse a single derived cluster XML file against the base clusters of the worker process.
+
+    :param cluster_parser: Instance of ClusterParser.
+    :param file_path: Path to the derived cluster XML file.
+    :param yaml_file_path: returns: Cluster object
+    :returns: Cluster object
+
+    """
+    return cluster_parser.parse_cluster_file(file_path, yaml_file_path,
+                                             _worker_base_clusters)
+
+
+def parse_files_in_parallel(parse_function,
+                            file_paths,
+                            initializer=None,
+                            initargs=()):
+    """Parse files in a pool of worker processes.
+    The XML parsing is CPU bound, so processes are used instead of threads to avoid the GIL.
+    Results are returned in the order of the given file paths so that the output does not depend on scheduling.
+
+    :param parse_function: Picklable function taking a file path and returning the parsed object.
+    :param file_paths: List of file paths to parse.
+    :param initializer: Function called once in every worker process.  (Default value = None)
+    :param initargs: Arguments passed to the initializer.  (Default value = ())
+    :returns: List of parsed objects, one per file path.
+
+    """
+    if len(file_paths) == 0:
+        return []
+
+    max_workers = min(len(file_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=initializer,
+                             initargs=initargs) as executor:
+        return list(executor.map(parse_function, file_paths))
+
+
 def process_device_files(input_dir, device_json_file):
     """Process all device XML files from input directory and generate intermediate device json file.
 
     :param input_dir: Path to the directory containing the device XML files.
-    :param device_json_file: returns: None
-    :returns: None
+    :param device_json_file: Path to the file where the device JSON will be written, nothing is written if None.
+    :returns: List of device dictionaries sorted by id, None if processing failed.
 
     """
-    file_list = list_directory(input_dir)
-    if file_list is None:
+    device_xml_files = get_file_list_by_extension(input_dir, ".xml")
+    if len(device_xml_files) == 0:
+        logger.error(f"No device XML files found in {input_dir}")
         return
 
     devices = []
     device_parser = DeviceParser()
-    for file_name in file_list:
-        if file_name.endswith(".xml"):
-            file_path = os.path.join(input_dir, file_name)
-            device = parse_single_device_file(device_parser=device_parser,
-                                              file_path=file_path)
-            if device is None or device.name is None:
-                logger.error(
-                    f"********************** Processing of {file_name} failed************************"
-                )
-                continue
-
-            devices.append(device)
-            logger.info(
-                f"********************** Processing of {file_name} completed************************"
-            )
-        else:
-            logger.error(f"Skipping {file_name} as it is not a valid file")
+    results = parse_files_in_parallel(
+        partial(parse_single_device_file, device_parser), device_xml_files)
+    for file_path, device in zip(device_xml_files, results):
+        file_name = os.path.basename(file_path)
+        if device is None or device.name is None:
+            logger.error("Processing of %s failed", file_name)
             continue
 
-    devices_list = [device.to_dict() for device in devices]
-    devices_list.sort(key=lambda x: int(x.get("id"), 16))
-    # Save devices to JSON
-    if not write_to_json_file(device_json_file, devices_list):
-        logger.error(f"Failed to write to {device_json_file}")
-        return
-    logger.info(
-        f"\n\n--------------------------------------------------PROCESSING COMPLETE | GENERATED device json in {device_json_file}--------------------------------------------------\n\n"
-    )
+        devices.append(device)
+        logger.debug("Processing of %s completed", file_name)
 
-
-def generate_json(chip_path, chip_version_dir, output_dir):
+    devices_list = [device.to_dict() for device in sort_by_id(devices)]
+    # Save devices to JSON
+    if device_json_file is not None:
+        if not write_to_json_file(device_json_file, devices_list):
+            logger.error(f"Failed to write to {device_json_file}")
+            return
+        logger.info("Processing complete, generated device json in %s",
+                    device_json_file)
+    return devices_list
+
+
+def generate_json(chip_path,
+                  chip_version_dir,
+                  output_dir,
+                  keep_intermediate=True,
+                  cluster_hierarchy_hints=None):
     """Generate JSON files for the given chip path and chip version.
+    The generated cluster and device lists are also returned, so they can be combined without reading the files back.
 
     :param chip_path: param chip_version_dir:
     :param output_dir:
     :param chip_version_dir:
+    :param keep_intermediate: Write clusters.json and device_types.json to the output directory.  (Default value = True)
+    :param cluster_hierarchy_hints: List of regex patterns of derived cluster file names, the built-in hints if None.  (Default value = None)
+    :returns: Tuple of (cluster dictionaries, device dictionaries), None if processing failed.
 
     """
 
@@ -240,40 +371,45 @@ def generate_json(chip_path, chip_version_dir, output_dir):
     current_dir = os.path.dirname(os.path.abspath(__file__))
 
     json_generated_dir = os.path.join(current_dir, output_dir)
-    if not create_output_directory(json_generated_dir):
-        return
 
     # Intermediate json files.
     # Cluster files contains all the clusters with their attributes, commands, events, etc.
     # Device files contains all the device types with the clusters used by the device.
-    cluster_json_file = os.path.join(json_generated_dir, "clusters.json")
-    device_json_file = os.path.join(json_generated_dir, "device_types.json")
+    cluster_json_file = None
+    device_json_file = None
+    if keep_intermediate:
+        if not create_output_directory(json_generated_dir):
+            return
+        cluster_json_file = os.path.join(json_generated_dir, "clusters.json")
+        device_json_file = os.path.join(json_generated_dir,
+                                        "device_types.json")
 
     # Process all files from default directories
     xml_input_dir = os.path.join(chip_path, f"data_model/{chip_version_dir}/")
     cluster_input_dir = os.path.join(xml_input_dir, "clusters/")
     device_input_dir = os.path.join(xml_input_dir, "device_types/")
 
-    logger.info(
-        "************************************************* Processing device files *************************************************"
-    )
+    logger.info("Processing device files")
     # Process device files
-    process_device_files(input_dir=device_input_dir,
-                         device_json_file=device_json_file)
+    devices_list = process_device_files(input_dir=device_input_dir,
+                                        device_json_file=device_json_file)
 
-    logger.info(
-        "\n\n************************************************* Processing cluster files *************************************************"
-    )
+    logger.info("Processing cluster files")
     # Process cluster files
     if yaml_file_path is None:
         logger.error("Yaml file path is not provided")
         return
-    process_cluster_files(
+    clusters_list = process_cluster_files(
         input_dir=cluster_input_dir,
         yaml_file_path=yaml_file_path,
         cluster_json_file=cluster_json_file,
+        hierarchy_hints=cluster_hierarchy_hints,
     )
 
+    if devices_list is None or clusters_list is None:
+        return
+    return clusters_list, devices_list
+
 
 # Main execution
 def main():
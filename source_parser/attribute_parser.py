@@ -11,18 +11,162 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from lxml import etree as ET
+
 from source_parser.conformance import parse_conformance
 from source_parser.conformance import parse_otherwise_conformance
-from source_parser.data_type_parser import DataTypeParser
 from source_parser.elements import Attribute
 from source_parser.elements import Cluster
 from utils.attribute_type import attribute_type_map
 from utils.helper import check_valid_id
 from utils.helper import safe_get_attr
 from utils.logger import setup_logger
+from utils.xml_utils import find_first
 
 logger = setup_logger()
 
+# Precompiled XPath expressions of the child lookups done for every attribute
+_XP_MANDATORY = ET.XPath("mandatoryConform")
+_XP_FROM = ET.XPath("from")
+_XP_TO = ET.XPath("to")
+
+# Default max value of an attribute with only a min or max constraint, by type
+_DEFAULT_MAX = {
+    "uint8": "254",
+    "int8": "254",
+    "uint16": "65534",
+    "int16": "65534",
+    "uint32": "65535",
+    "int32": "65535",
+    "uint64": "65535",
+    "int64": "65535",
+}
+
+# Enum and bitmap type -> (max value of the type, next larger type) used when the default value does not fit
+_TYPE_PROMOTIONS = {
+    "enum8": (255, "enum16"),
+    "enum16": (65535, "enum32"),
+    "enum32": (4294967295, "enum64"),
+    "bitmap8": (255, "bitmap16"),
+    "bitmap16": (65535, "bitmap32"),
+    "bitmap32": (4294967295, "bitmap64"),
+}
+
+
+def _is_intlike(value):
+    """Check if a value parses as a decimal integer, negative values included
+
+    :param value: The value to check.
+    :returns: True if int(value) succeeds, False otherwise.
+
+    """
+    try:
+        int(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+class AttributeChildren:
+    """Child elements of an attribute element used while parsing it, collected in a single pass over its children"""
+
+    # Tag of the child element -> name of the attribute storing it
+    TAG_TO_FIELD = {
+        "mandatoryConform": "mandatory_conform",
+        "optionalConform": "optional_conform",
+        "otherwiseConform": "otherwise_conform",
+        "deprecateConform": "deprecate_conform",
+        "disallowConform": "disallow_conform",
+        "access": "access",
+        "quality": "quality",
+        "constraint": "constraint",
+    }
+
+    def __init__(self, attribute):
+        """
+        :param attribute: The attribute element from the cluster XML file.
+        """
+        self.mandatory_conform = None
+        self.optional_conform = None
+        self.otherwise_conform = None
+        self.deprecate_conform = None
+        self.disallow_conform = None
+        self.access = None
+        self.quality = None
+        self.constraint = None
+        # Name of the first condition of the optional conformance
+        self.condition_name = None
+        # Lowercased type of the attribute element, set by AttributeParser._get_attribute_type()
+        self.type_lower = None
+        for child in attribute:
+            field = self.TAG_TO_FIELD.get(child.tag)
+            # Keep the first child of each tag, the same as attribute.find()
+            if field is not None and getattr(self, field) is None:
+                setattr(self, field, child)
+        if self.optional_conform is not None:
+            for child in self.optional_conform:
+                if child.tag == "condition":
+                    self.condition_name = child.get("name")
+                    break
+
+
+class ConstraintState:
+    """Values collected from the children of a constraint element"""
+
+    def __init__(self):
+        self.constraint_type = None
+        self.constraint_value = None
+        self.from_value = None
+        self.to_value = None
+
+
+def _parse_value_constraint(child, state):
+    """Handle a maxLength, min or max constraint child element.
+
+    :param child: The child element of the constraint element.
+    :param state: ConstraintState to update.
+
+    """
+    state.constraint_type = child.tag
+    state.constraint_value = child.get("value")
+
+
+def _parse_between_constraint(child, state):
+    """Handle a between constraint child element.
+
+    :param child: The child element of the constraint element.
+    :param state: ConstraintState to update.
+
+    """
+    state.constraint_type = "between"
+    from_elem = find_first(_XP_FROM, child)
+    to_elem = find_first(_XP_TO, child)
+    state.from_value = from_elem.get("value") if from_elem is not None else "0"
+    state.to_value = to_elem.get("value") if to_elem is not None else "0"
+
+
+def _parse_desc_constraint(child, state):
+    """Handle a desc constraint child element.
+
+    :param child: The child element of the constraint element.
+    :param state: ConstraintState to update.
+
+    """
+    state.constraint_type = "desc"
+    desc_text = child.text
+    if desc_text and desc_text.strip():
+        state.constraint_value = desc_text.strip()
+
+
+# Tag of a constraint child element -> handler updating the ConstraintState
+_CONSTRAINT_HANDLERS = {
+    "maxLength": _parse_value_constraint,
+    "min": _parse_value_constraint,
+    "max": _parse_value_constraint,
+    "between": _parse_between_constraint,
+    "desc": _parse_desc_constraint,
+}
+
 
 class AttributeParser:
     """Class for parsing attribute data"""
@@ -35,7 +179,11 @@ class AttributeParser:
         """Initialize the AttributeParser"""
         self.cluster = cluster
         self.feature_map = feature_map if feature_map else {}
-        self.processed_attrs = set()
+        self._processed_attr_names: set[str] = set()
+        # Enum and bitmap data types of the cluster, looked up once instead of for every attribute
+        data_types = safe_get_attr(cluster, "data_types", {})
+        self._enums_map = data_types.get("enums", {})
+        self._bitmaps_map = data_types.get("bitmaps", {})
 
     def parse_attributes(self, root, base_attributes: list[Attribute] = None):
         """Iterate over all attributes in the cluster and create Attribute objects.
@@ -46,56 +194,79 @@ class AttributeParser:
         :param base_attributes: list[Attribute]:  (Default value = None)
 
         """
-        for attribute in root.findall("attributes/attribute"):
-            if not self._should_process_attribute(attribute, base_attributes):
-                continue
-            attr = self._create_attribute(attribute)
-            self._process_attribute_access(attr, attribute)
-            self._process_attribute_conformance(attr, attribute,
-                                                self.feature_map)
-            self._get_attribute_min_max_value(attr, attribute)
-
-            if self.cluster.name in attribute_type_map.keys():
-                if attr.name in attribute_type_map[self.cluster.name].keys():
-                    attr.type = attribute_type_map[self.cluster.name][
-                        attr.name]["type"]
-                    attr.min_value = attribute_type_map[self.cluster.name][
-                        attr.name]["min"]
-                    attr.max_value = attribute_type_map[self.cluster.name][
-                        attr.name]["max"]
-            self.cluster.attributes.add(attr)
+        # Attribute type overrides of this cluster, looked up once for all its attributes
+        cluster_type_map = attribute_type_map.get(self.cluster.name)
+
+        # Base attributes by name, keeping the first attribute of each name
+        base_attributes_by_name = {}
+        if base_attributes:
+            for base_attribute in base_attributes:
+                base_attributes_by_name.setdefault(base_attribute.name,
+                                                   base_attribute)
+
+        # Attribute elements are visited one at a time instead of collecting them in a list first,
+        # a cluster without an attributes section only costs a scan of the root's children
+        for attributes_elem in root.iterchildren("attributes"):
+            for attribute in attributes_elem.iterchildren("attribute"):
+                self._parse_attribute(attribute, base_attributes_by_name,
+                                      cluster_type_map)
 
         # Add base attributes to the cluster if they are not already in the cluster
         if base_attributes:
             for base_attribute in base_attributes:
-                if base_attribute.name not in self.processed_attrs:
+                if base_attribute.name not in self._processed_attr_names:
                     self.cluster.attributes.add(base_attribute)
 
         logger.debug(
             f"Processed {len(self.cluster.attributes)} attributes for cluster {safe_get_attr(self.cluster, 'name')}"
         )
 
+    def _parse_attribute(self,
+                         attribute,
+                         base_attributes_by_name: dict,
+                         cluster_type_map: dict = None):
+        """Create an Attribute object from an attribute element and add it to the cluster.
+
+        :param attribute: The attribute element from the cluster XML file.
+        :param base_attributes_by_name: Base attributes by name.
+        :param cluster_type_map: Attribute type overrides of the cluster from attribute_type_map.  (Default value = None)
+
+        """
+        children = AttributeChildren(attribute)
+        if not self._should_process_attribute(
+                attribute, base_attributes_by_name, children):
+            return
+        attr = self._create_attribute(attribute, children)
+        self._process_attribute_conformance(attr, children, self.feature_map)
+        self._get_attribute_min_max_value(attr, attribute, children)
+
+        if cluster_type_map is not None:
+            type_override = cluster_type_map.get(attr.name)
+            if type_override is not None:
+                attr.type = type_override["type"]
+                attr.min_value = type_override["min"]
+                attr.max_value = type_override["max"]
+        self.cluster.attributes.add(attr)
+
     def _should_process_attribute(self,
                                   attribute,
-                                  base_attributes: list[Attribute] = None):
+                                  base_attributes_by_name: dict = None,
+                                  children: AttributeChildren = None):
         """Check if attribute should be processed or not.
 
-        :param attribute: param base_attributes: list[Attribute]:  (Default value = None)
-        :param base_attributes: list[Attribute]:  (Default value = None)
+        :param attribute: The attribute element from the cluster XML file.
+        :param base_attributes_by_name: Base attributes by name.  (Default value = None)
+        :param children: Child elements of the attribute, collected from the attribute if None.  (Default value = None)
         :returns: True if the attribute should be processed, False otherwise.
 
         """
         base_attribute = None
         attribute_name = attribute.get("name")
-        if attribute_name in self.processed_attrs:
+        if attribute_name in self._processed_attr_names:
             return False
-        self.processed_attrs.add(attribute_name)
-        if base_attributes:
-            base_attribute = next(
-                (attr for attr in base_attributes
-                 if attr.name == attribute.get("name")),
-                None,
-            )
+        self._processed_attr_names.add(attribute_name)
+        if base_attributes_by_name:
+            base_attribute = base_attributes_by_name.get(attribute_name)
             if not attribute.get("id") and base_attribute:
                 attribute.set("id", base_attribute.id)
             if not attribute.get("type") and base_attribute:
@@ -112,15 +283,9 @@ class AttributeParser:
             )
             return False
 
-        if attribute_name in [
-                safe_get_attr(a, "name") for a in self.processed_attrs
-        ]:
-            logger.debug(
-                f"Skipping - attribute already exists in processed attributes {attribute_name}"
-            )
-            return False
-
-        if self._check_conformance_restrictions(attribute, attribute_name):
+        if children is None:
+            children = AttributeChildren(attribute)
+        if self._check_conformance_restrictions(children, attribute_name):
             logger.debug(
                 f"Skipping - attribute {attribute_name} due to conformance restrictions"
             )
@@ -128,94 +293,105 @@ class AttributeParser:
 
         return True
 
-    def _check_conformance_restrictions(self, attribute, attribute_name):
+    def _check_conformance_restrictions(self, children, attribute_name):
         """Check if the attribute has any conformance restrictions.
 
-        :param attribute: The attribute element from the cluster XML file.
+        :param children: Child elements of the attribute element from the cluster XML file.
         :param attribute_name: returns: True if the attribute should be processed, False otherwise.
         :returns: True if the attribute should be processed, False otherwise.
 
         """
-        deprecate_conform = attribute.find("deprecateConform")
-        if deprecate_conform is not None:
+        if children.deprecate_conform is not None:
             logger.debug(f"Skipping - deprecated attribute {attribute_name}")
             return True
 
-        disallow_conform = attribute.find("disallowConform")
-        if disallow_conform is not None:
+        if children.disallow_conform is not None:
             logger.debug(
                 f"Skipping - disallow conformance for {attribute_name}")
             return True
 
-        optional_conform = attribute.find("optionalConform")
-        condition = None if optional_conform is None else optional_conform.find(
-            "condition")
-
-        if (optional_conform is not None and condition is not None
-                and condition.get("name") == "Zigbee"):
+        if children.condition_name == "Zigbee":
             logger.debug(f"Skipping - Zigbee specific {attribute_name}")
             return True
         return False
 
-    def _create_attribute(self, attribute):
+    def _create_attribute(self, attribute, children: AttributeChildren):
         """Create an Attribute object from XML data
 
         :param attribute: returns: The created Attribute object.
+        :param children: Child elements of the attribute.
         :returns: The created Attribute object.
 
         """
         attribute_name = attribute.get("name")
         attribute_code = attribute.get("id")
 
-        attribute_type = self._get_attribute_type(attribute)
-        mandatory_conform = attribute.find("mandatoryConform")
-        otherwise_conform = attribute.find("otherwiseConform")
-        if otherwise_conform is not None and otherwise_conform.find(
-                "mandatoryConform") is not None:
-            mandatory_conform = otherwise_conform.find("mandatoryConform")
+        attribute_type = self._get_attribute_type(attribute, children)
+        mandatory_conform = children.mandatory_conform
+        otherwise_conform = children.otherwise_conform
+        if otherwise_conform is not None:
+            otherwise_mandatory_conform = find_first(_XP_MANDATORY,
+                                                     otherwise_conform)
+            if otherwise_mandatory_conform is not None:
+                mandatory_conform = otherwise_mandatory_conform
+
+        # Most attributes have no constraint, skip the parse calls for the missing child elements
+        access = (None if children.access is None else self._parse_access(
+            children.access))
+        quality = (None if children.quality is None else self._parse_quality(
+            children.quality))
+        constraint = (None if children.constraint is None else
+                      self._parse_constraint(children.constraint))
 
         return Attribute(
             name=attribute_name,
             id=attribute_code,
             type_=attribute_type,
             is_mandatory=mandatory_conform is not None,
-            access=self._parse_access(attribute.find("access")),
-            quality=self._parse_quality(attribute.find("quality")),
-            constraint=self._parse_constraint(attribute.find("constraint")),
+            access=access,
+            quality=quality,
+            constraint=constraint,
             default_value=attribute.get("default"),
         )
 
-    def _get_attribute_type(self, attribute):
+    def _get_attribute_type(self, attribute, children=None):
         """Get attribute type from XML
 
         :param attribute: returns: The attribute type after processing.
+        :param children: Child elements of the attribute, the lowercased type is stored on it for later steps.  (Default value = None)
         :returns: The attribute type after processing.
 
         """
         attribute_type = attribute.get("type")
         if attribute_type is None:
             return None
+        attribute_type = attribute_type.lower()
+        if children is not None:
+            children.type_lower = attribute_type
 
         # Get base type and handle cpp reserved words
-        attribute_type = attribute_type.split(" ")[0].lower()
+        attribute_type = attribute_type.split(" ")[0]
 
-        attribute_type = self.cluster.attribute_types.get(
-            attribute_type, self._handle_unknown_type(attribute_type))
+        # Unknown types are only handled on a miss instead of computing the default for every attribute
+        if attribute_type in self.cluster.attribute_types:
+            attribute_type = self.cluster.attribute_types[attribute_type]
+        else:
+            attribute_type = self._handle_unknown_type(attribute_type)
         attribute_type = self._update_attribute_type_by_default_value(
             attribute, attribute_type)
         return attribute_type
 
-    def _process_attribute_conformance(self, attr, attribute, feature_map):
+    def _process_attribute_conformance(self, attr, children, feature_map):
         """Process attribute conformance information from XML
 
         :param attr: The attribute object to process.
-        :param attribute: The attribute element from the cluster XML file.
+        :param children: Child elements of the attribute element from the cluster XML file.
         :param feature_map: The feature map.
 
         """
-        mandatory_conform = attribute.find("mandatoryConform")
-        optional_conform = attribute.find("optionalConform")
-        otherwise_conform = attribute.find("otherwiseConform")
+        mandatory_conform = children.mandatory_conform
+        optional_conform = children.optional_conform
+        otherwise_conform = children.otherwise_conform
 
         if mandatory_conform is not None:
             attr.conformance = parse_conformance(mandatory_conform,
@@ -226,24 +402,6 @@ class AttributeParser:
             attr.conformance = parse_otherwise_conformance(
                 otherwise_conform, feature_map)
 
-    def _process_attribute_access(self, attr, attribute):
-        """Process attribute access information from XML
-
-        :param attr: The attribute object to process.
-        :param attribute: The attribute element from the cluster XML file.
-
-        """
-        access_elem = attribute.find("access")
-        if access_elem is None:
-            return None
-
-        attr.access = Attribute.Access(
-            read=access_elem.get("read", "false"),
-            readPrivilege=access_elem.get("readPrivilege", None),
-            write=access_elem.get("write", "false"),
-            writePrivilege=access_elem.get("writePrivilege", None),
-        )
-
     def _parse_access(self, access_elem):
         """Parse access information from XML
 
@@ -299,52 +457,23 @@ class AttributeParser:
         if constraint_elem is None:
             return None
 
-        constraint_type = None
-        constraint_value = None
-        from_value = None
-        to_value = None
-
+        state = ConstraintState()
         for child in constraint_elem:
-            if child.tag == "maxLength":
-                constraint_type = "maxLength"
-                constraint_value = child.get("value")
-            elif child.tag == "min":
-                constraint_type = "min"
-                constraint_value = child.get("value")
-            elif child.tag == "max":
-                constraint_type = "max"
-                constraint_value = child.get("value")
-            elif child.tag == "between":
-                constraint_type = "between"
-                from_elem = child.find("from")
-                to_elem = child.find("to")
-
-                if from_elem is not None:
-                    from_value = from_elem.get("value")
-                else:
-                    from_value = "0"
-
-                if to_elem is not None:
-                    to_value = to_elem.get("value")
-                else:
-                    to_value = "0"
-            elif child.tag == "desc":
-                constraint_type = "desc"
-                desc_text = child.text
-                if desc_text and desc_text.strip():
-                    constraint_value = desc_text.strip()
-
-        if constraint_type == "between":
-            return Attribute.Constraint(type=constraint_type,
-                                        from_=from_value,
-                                        to_=to_value,
+            handler = _CONSTRAINT_HANDLERS.get(child.tag)
+            if handler is not None:
+                handler(child, state)
+
+        if state.constraint_type == "between":
+            return Attribute.Constraint(type=state.constraint_type,
+                                        from_=state.from_value,
+                                        to_=state.to_value,
                                         value=None)
         else:
             return Attribute.Constraint(
-                type=constraint_type,
-                from_=constraint_value,
-                to_=constraint_value,
-                value=constraint_value,
+                type=state.constraint_type,
+                from_=state.constraint_value,
+                to_=state.constraint_value,
+                value=state.constraint_value,
             )
 
     def _handle_unknown_type(self, attribute_type):
@@ -354,38 +483,43 @@ class AttributeParser:
         :returns: The attribute type after processing.
 
         """
-        if "bitmap" in attribute_type.lower():
+        attribute_type_lower = attribute_type.lower()
+        if "bitmap" in attribute_type_lower:
             return "uint8"
-        if "enum" in attribute_type.lower():
+        if "enum" in attribute_type_lower:
             return "uint8"
-        if "struct" in attribute_type.lower():
+        if "struct" in attribute_type_lower:
             return "list"
         return attribute_type
 
-    def _get_attribute_min_max_value(self, attr, attribute):
+    def _get_attribute_min_max_value(self, attr, attribute, children):
         """Get the min and max value of the attribute
 
         :param attr: The attribute object to process.
         :param attribute: The attribute element from the cluster XML file.
+        :param children: Child elements of the attribute element.
 
         """
         # Initialize min and max values based on data type
         attr.min_value = None
         attr.max_value = None
 
+        # Type category of the attribute, computed once
+        attr_type_lower = attr.type.lower()
+        is_enum = "enum" in attr_type_lower
+        is_bitmap = "bitmap" in attr_type_lower
+
         # Get constraint element
-        constraint_elem = attribute.find("constraint")
-        if (constraint_elem is None and "enum" not in attr.type.lower()
-                and "bitmap" not in attr.type.lower()):
+        constraint_elem = children.constraint
+        if constraint_elem is None and not is_enum and not is_bitmap:
             return
 
         # Handle enum types
-        if "enum" in attr.type.lower():
+        if is_enum:
             # For enums, check if it's in the data_types to get number of items
-            attr_type = attribute.get("type").lower()
-            if attr_type in self.cluster.data_types.get("enums", {}):
-                enum_data = self.cluster.data_types.get("enums",
-                                                        {}).get(attr_type)
+            attr_type = children.type_lower
+            if attr_type in self._enums_map:
+                enum_data = self._enums_map[attr_type]
                 if enum_data and hasattr(enum_data, "items"):
                     # Set bounds based on number of enum items
                     attr.min_value = "0"
@@ -396,35 +530,40 @@ class AttributeParser:
                     f"Skipping - enum {attr_type} not found in data_types")
                 return
         # Handle bitmap types
-        elif "bitmap" in attr.type.lower():
+        elif is_bitmap:
             # For bitmaps, check if it's in the data_types to get highest bit
-            attr_type = attribute.get("type").lower()
-            if attr_type in self.cluster.data_types.get("bitmaps", {}):
-                bitmap_data = self.cluster.data_types.get("bitmaps",
-                                                          {}).get(attr_type)
+            attr_type = children.type_lower
+            if attr_type in self._bitmaps_map:
+                bitmap_data = self._bitmaps_map[attr_type]
                 if bitmap_data and hasattr(bitmap_data, "bitfields"):
                     attr.min_value = "0"
-                    attr.max_value = str(2**len(bitmap_data.bitfields) - 1)
+                    attr.max_value = str((1 << len(bitmap_data.bitfields)) -
+                                         1)
                     return
             else:
                 logger.debug(
                     f"Skipping - bitmap {attr_type} not found in data_types")
                 return
         else:
+            # Collect the first child of each tag in a single pass over the constraint element
+            constraint_children = {}
+            for child in constraint_elem:
+                constraint_children.setdefault(child.tag, child)
+
             # Check for direct min/max values
-            min_elem = constraint_elem.find("min")
+            min_elem = constraint_children.get("min")
             if min_elem is not None and min_elem.get("value") is not None:
                 attr.min_value = min_elem.get("value")
 
-            max_elem = constraint_elem.find("max")
+            max_elem = constraint_children.get("max")
             if max_elem is not None and max_elem.get("value") is not None:
                 attr.max_value = max_elem.get("value")
 
             # Check for between values
-            between_elem = constraint_elem.find("between")
+            between_elem = constraint_children.get("between")
             if between_elem is not None:
-                from_elem = between_elem.find("from")
-                to_elem = between_elem.find("to")
+                from_elem = find_first(_XP_FROM, between_elem)
+                to_elem = find_first(_XP_TO, between_elem)
 
                 if from_elem is not None and from_elem.get(
                         "value") is not None:
@@ -434,10 +573,10 @@ class AttributeParser:
                     attr.max_value = to_elem.get("value")
 
             # Check for lengthBetween values (for strings)
-            length_between_elem = constraint_elem.find("lengthBetween")
+            length_between_elem = constraint_children.get("lengthBetween")
             if length_between_elem is not None:
-                from_elem = length_between_elem.find("from")
-                to_elem = length_between_elem.find("to")
+                from_elem = find_first(_XP_FROM, length_between_elem)
+                to_elem = find_first(_XP_TO, length_between_elem)
 
                 if from_elem is not None and from_elem.get(
                         "value") is not None:
@@ -447,7 +586,7 @@ class AttributeParser:
                     attr.max_value = to_elem.get("value")
 
             # Check for maxLength (for strings)
-            max_length_elem = constraint_elem.find("maxLength")
+            max_length_elem = constraint_children.get("maxLength")
             if max_length_elem is not None and max_length_elem.get(
                     "value") is not None:
                 attr.max_value = max_length_elem.get("value")
@@ -458,7 +597,8 @@ class AttributeParser:
                     or attr.min_value is not None and attr.max_value is None):
                 self._get_default_bounds_by_type(attr)
         if (attr.min_value is not None and attr.max_value is not None and
-            (not attr.min_value.isdigit() or not attr.max_value.isdigit())):
+            (not _is_intlike(attr.min_value)
+             or not _is_intlike(attr.max_value))):
             attr.min_value = None
             attr.max_value = None
 
@@ -471,12 +611,7 @@ class AttributeParser:
         if attr.min_value is None:
             attr.min_value = "0"
         if attr.max_value is None:
-            attr.max_value = (
-                "254" if attr.type == "uint8" or attr.type == "int8" else
-                ("65534" if attr.type == "uint16" or attr.type == "int16" else
-                 ("65535"
-                  if attr.type == "uint32" or attr.type == "int32" else "65535"
-                  if attr.type == "uint64" or attr.type == "int64" else None)))
+            attr.max_value = _DEFAULT_MAX.get(attr.type)
 
     def _update_attribute_type_by_default_value(self, attribute,
                                                 attribute_type) -> str:
@@ -487,30 +622,23 @@ class AttributeParser:
         :param attribute_type: The attribute type.
 
         """
+        # Only enum and bitmap types can be promoted, skip parsing the default value of every other type
+        promotion = _TYPE_PROMOTIONS.get(attribute_type)
+        if promotion is None:
+            return attribute_type
         default_value = attribute.get("default")
+        if default_value is None:
+            return attribute_type
         try:
-            if default_value is not None:
-                if default_value.startswith("0x"):
-                    default_value = int(default_value, 16)
-                elif default_value.isdigit():
-                    default_value = int(default_value)
-                else:
-                    default_value = None
+            if default_value.startswith("0x"):
+                default_value = int(default_value, 16)
+            elif default_value.isdigit():
+                default_value = int(default_value)
+            else:
+                return attribute_type
         except ValueError:
             return attribute_type
 
-        if default_value is not None:
-            if default_value > 255 and attribute_type == "enum8":
-                attribute_type = "enum16"
-            elif default_value > 65535 and attribute_type == "enum16":
-                attribute_type = "enum32"
-            elif int(
-                    default_value) > 4294967295 and attribute_type == "enum32":
-                attribute_type = "enum64"
-            elif default_value > 255 and attribute_type == "bitmap8":
-                attribute_type = "bitmap16"
-            elif default_value > 65535 and attribute_type == "bitmap16":
-                attribute_type = "bitmap32"
-            elif default_value > 4294967295 and attribute_type == "bitmap32":
-                attribute_type = "bitmap64"
+        if default_value > promotion[0]:
+            attribute_type = promotion[1]
         return attribute_type
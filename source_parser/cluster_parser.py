@@ -12,29 +12,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
-import xml.etree.ElementTree as ET
+
+from lxml import etree as ET
 
 from .attribute_parser import AttributeParser
 from .command_parser import CommandParser
 from .data_type_parser import DataTypeParser
 from .event_parser import EventParser
 from .feature_parser import FeatureParser
-from .yaml_parser import YamlParser
+from .yaml_parser import get_yaml_parser
 from source_parser.elements import Cluster
 from utils.file_utils import load_json_file
 from utils.helper import check_valid_id
 from utils.helper import esp_name
 from utils.helper import hex_to_int
-from utils.helper import safe_get_attr
 from utils.logger import setup_logger
+from utils.xml_utils import find_first
+from utils.xml_utils import parse_xml_file
 
 logger = setup_logger()
 DUMMY_CLUSTER_ID = hex(0xFFFF)
 
+# Precompiled XPath expressions of the lookups done for every cluster file
+_XP_CLASSIFICATION = ET.XPath("classification")
+_XP_CLUSTER_IDS = ET.XPath("clusterIds")
+_XP_CLUSTER_ID = ET.XPath("clusterId")
+_XP_REVISION = ET.XPath("revision")
+
+# Callback flags a derived cluster inherits from its base cluster
+_INHERITED_FLAGS = (
+    "delegate_init_callback_available",
+    "attribute_changed_function_available",
+    "shutdown_function_available",
+    "pre_attribute_change_function_available",
+    "plugin_init_cb_available",
+)
+
 
 class ClusterParser:
     """Class for parsing cluster data"""
 
+    def __init__(self, parser=None):
+        """
+        :param parser: lxml XMLParser used for all the files, the shared parser of the current thread if None.
+                       lxml parsers cannot be pickled, so leave it None when the instance is sent to worker processes.  (Default value = None)
+        """
+        self.parser = parser
+
     def parse_cluster_file(
         self,
         file_path,
@@ -53,8 +77,7 @@ class ClusterParser:
 
         """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            root = parse_xml_file(file_path, self.parser)
         except ET.ParseError as e:
             logger.error(f"XML parsing error in {file_path}: {str(e)}")
             return []
@@ -75,6 +98,15 @@ class ClusterParser:
             logger.error(f"Skipping {file_path} as it is not a valid cluster")
             return clusters
 
+        # Base clusters by esp name, built once per file instead of normalizing every base cluster name per lookup
+        base_clusters_by_name = {}
+        if base_clusters:
+            for bc in base_clusters:
+                base_clusters_by_name.setdefault(esp_name(bc.name), bc)
+
+        # Data types only depend on the file, they are parsed once for all its clusters on the first valid cluster
+        data_type_parser = None
+
         for cluster_name, cluster_id in cluster_name_id_list:
             if not cluster_name or not cluster_id:
                 logger.warning(
@@ -85,10 +117,18 @@ class ClusterParser:
                 logger.warning(
                     f"Skipping {file_path} as id is not valid: {cluster_id}")
                 continue
-            if base_clusters:
-                base_cluster = self._get_base_cluster(root, base_clusters)
+            if base_clusters_by_name:
+                base_cluster = self._get_base_cluster(root,
+                                                      base_clusters_by_name)
             else:
                 base_cluster = None
+            if data_type_parser is None:
+                data_type_parser = DataTypeParser()
+                if base_cluster:
+                    # Data types defined in the base cluster file can be used by the derived cluster file
+                    data_type_parser.attribute_types.update(
+                        base_cluster.attribute_types)
+                data_type_parser.parse_data_types(root)
             cluster = self._parse_cluster(
                 root,
                 cluster_name,
@@ -96,6 +136,7 @@ class ClusterParser:
                 cluster_revision,
                 yaml_file_path,
                 base_cluster,
+                data_type_parser,
             )
             clusters.append(cluster)
         return clusters
@@ -108,16 +149,9 @@ class ClusterParser:
         :param base_cluster: The base cluster.
 
         """
-        if base_cluster.delegate_init_callback_available:
-            derived_cluster.delegate_init_callback_available = True
-        if base_cluster.attribute_changed_function_available:
-            derived_cluster.attribute_changed_function_available = True
-        if base_cluster.shutdown_function_available:
-            derived_cluster.shutdown_function_available = True
-        if base_cluster.pre_attribute_change_function_available:
-            derived_cluster.pre_attribute_change_function_available = True
-        if base_cluster.plugin_init_cb_available:
-            derived_cluster.plugin_init_cb_available = True
+        for flag in _INHERITED_FLAGS:
+            if getattr(base_cluster, flag):
+                setattr(derived_cluster, flag, True)
 
     def _parse_cluster(
         self,
@@ -127,6 +161,7 @@ class ClusterParser:
         cluster_revision,
         yaml_file_path,
         base_cluster: Cluster = None,
+        data_type_parser: DataTypeParser = None,
     ):
         """Parse a cluster from XML
 
@@ -137,6 +172,7 @@ class ClusterParser:
         :param yaml_file_path: The path to the YAML file.
         :param base_cluster: Cluster:  (Default value = None)
         :param base_cluster: Cluster:  (Default value = None)
+        :param data_type_parser: DataTypeParser which already parsed the data types of root, parsed here if None.  (Default value = None)
         :returns: The parsed cluster.
 
         """
@@ -148,18 +184,9 @@ class ClusterParser:
         if base_cluster:
             self._inherit_from_base_cluster(cluster, base_cluster)
 
-        # Parse classification
-        classification = root.find("classification")
-        if classification is not None:
-            # Default to 'application' if role is not specified
-            cluster.role = classification.get("role", "application")
-            cluster.hierarchy = classification.get("hierarchy")
-            base_cluster_name = classification.get("baseCluster")
-            if base_cluster_name:
-                cluster.base_cluster_name = esp_name(base_cluster_name)
-            cluster.pics_code = classification.get("picsCode")
-            cluster.scope = classification.get("scope")
-        else:
+        # Parse classification and revision history in a single pass over the top level sections
+        parsed_sections = self._parse_sections(cluster, root)
+        if "classification" not in parsed_sections:
             logger.debug(
                 f"Classification element not found for cluster {cluster_name}, using default role 'application'"
             )
@@ -167,10 +194,16 @@ class ClusterParser:
 
         self._process_cluster_yaml(cluster, yaml_file_path)
 
-        # Parse revision history
-        self._parse_revision_history(cluster, root)
+        if data_type_parser is None:
+            data_type_parser = DataTypeParser()
+            if base_cluster:
+                data_type_parser.attribute_types.update(
+                    base_cluster.attribute_types)
+            data_type_parser.parse_data_types(root)
+        cluster.attribute_types = data_type_parser.attribute_types
+        # Store complete data type information, before creating the element parsers which use it
+        cluster.data_types = data_type_parser.get_data_types()
 
-        data_type_parser = DataTypeParser()
         feature_parser = FeatureParser(root, cluster)
         feature_map = feature_parser.create_feature_map()
         feature_parser.feature_map = feature_map
@@ -179,10 +212,6 @@ class ClusterParser:
         command_parser = CommandParser(cluster, feature_parser.feature_map)
         event_parser = EventParser(cluster, feature_parser.feature_map)
 
-        cluster.attribute_types = data_type_parser.parse_data_types(root)
-        # Store complete data type information
-        cluster.data_types = data_type_parser.get_data_types()
-
         base_attributes = base_cluster.attributes if base_cluster else []
         base_commands = base_cluster.commands if base_cluster else []
         base_events = base_cluster.events if base_cluster else []
@@ -193,28 +222,65 @@ class ClusterParser:
         feature_parser.compute_features(feature_parser.feature_map,
                                         base_features)
         logger.debug(
-            f"****************************Processed cluster {safe_get_attr(cluster, 'name')} SUCCESSFULLY****************************"
+            f"****************************Processed cluster {cluster.name} SUCCESSFULLY****************************"
         )
         return cluster
 
-    def _parse_revision_history(self, cluster, root):
+    def _parse_sections(self, cluster, root):
+        """Parse the top level sections of a cluster XML file that have a handler in _SECTION_HANDLERS
+        Only the first section with a given tag is parsed, the same as with root.find().
+
+        :param cluster: The cluster to parse the sections for.
+        :param root: The root element of the cluster XML file.
+        :returns: The set of parsed section tags.
+
+        """
+        parsed_tags = set()
+        for section in root:
+            handler = self._SECTION_HANDLERS.get(section.tag)
+            if handler is not None and section.tag not in parsed_tags:
+                parsed_tags.add(section.tag)
+                handler(self, cluster, section)
+        return parsed_tags
+
+    def _parse_classification(self, cluster, classification):
+        """Parse classification from XML
+
+        :param cluster: The cluster to parse the classification for.
+        :param classification: The classification element of the cluster XML file.
+
+        """
+        # Default to 'application' if role is not specified
+        cluster.role = classification.get("role", "application")
+        cluster.hierarchy = classification.get("hierarchy")
+        base_cluster_name = classification.get("baseCluster")
+        if base_cluster_name:
+            cluster.base_cluster_name = esp_name(base_cluster_name)
+        cluster.pics_code = classification.get("picsCode")
+        cluster.scope = classification.get("scope")
+
+    def _parse_revision_history(self, cluster, revision_history_elem):
         """Parse revision history from XML
 
         :param cluster: The cluster to parse the revision history for.
-        :param root: The root element of the cluster XML file.
+        :param revision_history_elem: The revisionHistory element of the cluster XML file.
 
         """
-        revision_history_elem = root.find("revisionHistory")
-        if revision_history_elem is not None:
-            for revision in revision_history_elem.findall("revision"):
-                revision_info = {
-                    "revision": revision.get("revision"),
-                    "summary": revision.get("summary"),
-                }
-                cluster.revision_history.append(revision_info)
-            logger.debug(
-                f"Parsed {len(safe_get_attr(cluster, 'revision_history', []))} revision history entries"
-            )
+        for revision in _XP_REVISION(revision_history_elem):
+            revision_info = {
+                "revision": revision.get("revision"),
+                "summary": revision.get("summary"),
+            }
+            cluster.revision_history.append(revision_info)
+        logger.debug(
+            f"Parsed {len(cluster.revision_history)} revision history entries"
+        )
+
+    # Handlers of the top level sections of a cluster XML file keyed by tag, built once for the class
+    _SECTION_HANDLERS = {
+        "classification": _parse_classification,
+        "revisionHistory": _parse_revision_history,
+    }
 
     def _get_cluster_name_and_id(self, root):
         """Get cluster name and id from XML
@@ -232,7 +298,9 @@ class ClusterParser:
             return name_id_list
 
         if not cluster_name or not cluster_id:
-            cluster_ids_element = root.find("clusterIds").findall("clusterId")
+            cluster_ids_elem = find_first(_XP_CLUSTER_IDS, root)
+            cluster_ids_element = ([] if cluster_ids_elem is None else
+                                   _XP_CLUSTER_ID(cluster_ids_elem))
             for cluster_id_element in cluster_ids_element:
                 cluster_name = cluster_id_element.get("name")
                 cluster_id = cluster_id_element.get("id")
@@ -244,23 +312,23 @@ class ClusterParser:
 
         return name_id_list
 
-    def _get_base_cluster(self, root, base_clusters: list[Cluster]):
+    def _get_base_cluster(self, root, base_clusters_by_name: dict):
         """Get base cluster from root
 
         :param root: The root element of the cluster XML file.
-        :param base_clusters: The base cluster list.
-        :param base_clusters: list[Cluster]:
-        :param base_clusters: list[Cluster]:
+        :param base_clusters_by_name: The base clusters by esp name.
+        :param base_clusters_by_name: dict:
 
         """
         base_cluster = None
-        base_cluster_name = root.find("classification").get("baseCluster")
+        classification = find_first(_XP_CLASSIFICATION, root)
+        # Files classified as derived by their name alone may have no classification, they are parsed without a base cluster
+        if classification is None:
+            return None
+        base_cluster_name = classification.get("baseCluster")
         if base_cluster_name:
-            base_cluster = next(
-                (bc for bc in base_clusters
-                 if esp_name(bc.name) == esp_name(base_cluster_name)),
-                None,
-            )
+            base_cluster = base_clusters_by_name.get(
+                esp_name(base_cluster_name))
         return base_cluster
 
     def _process_cluster_yaml(self, cluster, yaml_file_path: str):
@@ -273,27 +341,25 @@ class ClusterParser:
 
         """
         if yaml_file_path:
-            yaml_parser = YamlParser(yaml_file_path)
+            # Loaded once per process, not once per cluster
+            yaml_parser = get_yaml_parser(yaml_file_path)
+            cluster_name = cluster.name
             if yaml_parser.is_present_in_list(
-                    "CommandHandlerInterfaceOnlyClusters",
-                    safe_get_attr(cluster, "name")):
+                    "CommandHandlerInterfaceOnlyClusters", cluster_name):
                 cluster.command_handler_available = True
             if yaml_parser.is_present_in_list("ClustersWithInitFunctions",
-                                              safe_get_attr(cluster, "name")):
+                                              cluster_name):
                 cluster.init_function_available = True
             if yaml_parser.is_present_in_list(
-                    "ClustersWithAttributeChangedFunctions",
-                    safe_get_attr(cluster, "name")):
+                    "ClustersWithAttributeChangedFunctions", cluster_name):
                 cluster.attribute_changed_function_available = True
             if yaml_parser.is_present_in_list("ClustersWithShutdownFunctions",
-                                              safe_get_attr(cluster, "name")):
+                                              cluster_name):
                 cluster.shutdown_function_available = True
             if yaml_parser.is_present_in_list(
-                    "ClustersWithPreAttributeChangeFunctions",
-                    safe_get_attr(cluster, "name"),
-            ):
+                    "ClustersWithPreAttributeChangeFunctions", cluster_name):
                 cluster.pre_attribute_change_function_available = True
         else:
             logger.error(
-                f"Yaml file not found for cluster: {safe_get_attr(cluster, 'name')}"
+                f"Yaml file not found for cluster: {cluster.name}"
             )
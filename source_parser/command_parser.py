@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from lxml import etree as ET
+
 from source_parser.conformance import Conformance
 from source_parser.conformance import parse_conformance
 from source_parser.conformance import parse_otherwise_conformance
@@ -18,12 +20,116 @@ from source_parser.elements import Cluster
 from source_parser.elements import Command
 from source_parser.yaml_parser import YamlParser
 from utils.helper import check_valid_id
-from utils.helper import safe_get_attr
 from utils.logger import setup_logger
 from utils.mapping import command_callback_skip_list
+from utils.xml_utils import find_first
 
 logger = setup_logger()
 
+# Precompiled XPath expressions of the lookups done for every command and field
+_XP_COMMANDS = ET.XPath("commands/command")
+_XP_CONSTRAINT = ET.XPath("constraint")
+_XP_MANDATORY = ET.XPath("mandatoryConform")
+
+
+def _parse_value_constraint(constraint, child):
+    """Handle a maxLength, min or max constraint child element of a command field.
+
+    :param constraint: The constraint dictionary to update.
+    :param child: The child element of the constraint element.
+
+    """
+    constraint["type"] = child.tag
+    constraint["value"] = child.get("value")
+
+
+def _parse_between_constraint(constraint, child):
+    """Handle a between constraint child element of a command field.
+    The from and to elements are found in a single pass over its children.
+
+    :param constraint: The constraint dictionary to update.
+    :param child: The child element of the constraint element.
+
+    """
+    constraint["type"] = "between"
+    from_elem = None
+    to_elem = None
+    for grandchild in child:
+        # Keep the first from and to elements, the same as child.find()
+        if grandchild.tag == "from":
+            if from_elem is None:
+                from_elem = grandchild
+        elif grandchild.tag == "to":
+            if to_elem is None:
+                to_elem = grandchild
+
+    from_value = None if from_elem is None else from_elem.get("value")
+    to_value = None if to_elem is None else to_elem.get("value")
+    constraint["min"] = "0" if from_value is None else from_value
+    constraint["max"] = "0" if to_value is None else to_value
+
+
+def _parse_desc_constraint(constraint, child):
+    """Handle a desc constraint child element of a command field.
+
+    :param constraint: The constraint dictionary to update.
+    :param child: The child element of the constraint element.
+
+    """
+    constraint["type"] = "desc"
+    constraint["value"] = None
+
+
+# Tag of a constraint child element -> handler updating the constraint dictionary
+_CONSTRAINT_HANDLERS = {
+    "maxLength": _parse_value_constraint,
+    "min": _parse_value_constraint,
+    "max": _parse_value_constraint,
+    "between": _parse_between_constraint,
+    "desc": _parse_desc_constraint,
+}
+
+
+class CommandChildren:
+    """Child elements of a command element used while parsing it, collected in a single pass over its children"""
+
+    # Tag of the child element -> name of the attribute storing it
+    TAG_TO_FIELD = {
+        "mandatoryConform": "mandatory_conform",
+        "optionalConform": "optional_conform",
+        "otherwiseConform": "otherwise_conform",
+        "deprecateConform": "deprecate_conform",
+        "disallowConform": "disallow_conform",
+        "access": "access",
+    }
+
+    def __init__(self, command):
+        """
+        :param command: The command element from the cluster XML file.
+        """
+        self.mandatory_conform = None
+        self.optional_conform = None
+        self.otherwise_conform = None
+        self.deprecate_conform = None
+        self.disallow_conform = None
+        self.access = None
+        self.fields = []
+        # Name of the first condition of the optional conformance
+        self.condition_name = None
+        for child in command:
+            if child.tag == "field":
+                self.fields.append(child)
+                continue
+            field = self.TAG_TO_FIELD.get(child.tag)
+            # Keep the first child of each tag, the same as command.find()
+            if field is not None and getattr(self, field) is None:
+                setattr(self, field, child)
+        if self.optional_conform is not None:
+            for child in self.optional_conform:
+                if child.tag == "condition":
+                    self.condition_name = child.get("name")
+                    break
+
 
 class CommandParser:
     """Class for parsing command data"""
@@ -46,19 +152,31 @@ class CommandParser:
         :param base_commands: list[Command]:  (Default value = None)
 
         """
-        for command in root.findall("commands/command"):
-            if not self._should_process_command(command, base_commands):
+        # Base commands by name, keeping the first command of each name
+        base_commands_by_name = {}
+        if base_commands:
+            for base_command in base_commands:
+                base_commands_by_name.setdefault(base_command.name,
+                                                 base_command)
+
+        # Commands of clusters in the skip list are shared by several clusters, checked once for all commands
+        multi_cluster_command = (self.cluster.esp_name
+                                 in command_callback_skip_list)
+
+        for command in _XP_COMMANDS(root):
+            children = CommandChildren(command)
+            if not self._should_process_command(
+                    command, base_commands_by_name, children):
                 continue
 
-            cmd = self._create_command(command)
-            self._process_command_access(cmd, command)
-            self._process_command_conformance(cmd, command)
-            self._process_command_fields(cmd, command)
+            cmd = self._create_command(command, children)
+            self._process_command_access(cmd, children)
+            self._process_command_conformance(cmd, children)
+            self._process_command_fields(cmd, children)
 
             self.cluster.commands.add(cmd)
 
-            if safe_get_attr(self.cluster,
-                             "esp_name") in command_callback_skip_list:
+            if multi_cluster_command:
                 cmd.multi_cluster_command = True
 
         # Add base commands to the cluster if they are not already in the cluster
@@ -68,17 +186,18 @@ class CommandParser:
                     self.cluster.commands.add(base_command)
 
         logger.debug(
-            f"Processed {len(self.cluster.commands)} commands for cluster {safe_get_attr(self.cluster, 'name')}"
+            f"Processed {len(self.cluster.commands)} commands for cluster {self.cluster.name}"
         )
 
     def _should_process_command(self,
                                 command,
-                                base_commands: list[Command] = None):
+                                base_commands_by_name: dict = None,
+                                children: CommandChildren = None):
         """Check if command should be processed
 
         :param command: The command element from the cluster XML file.
-        :param base_commands: list[Command]:  (Default value = None)
-        :param base_commands: list[Command]:  (Default value = None)
+        :param base_commands_by_name: Base commands by name.  (Default value = None)
+        :param children: Child elements of the command, collected from the command if None.  (Default value = None)
         :returns: True if the command should be processed, False otherwise.
 
         """
@@ -86,10 +205,8 @@ class CommandParser:
         if command_name in self.processed_commands:
             return False
         self.processed_commands.add(command_name)
-        if base_commands:
-            base_command = next(
-                (cmd for cmd in base_commands if cmd.name == command_name),
-                None)
+        if base_commands_by_name:
+            base_command = base_commands_by_name.get(command_name)
             if not command.get("id") and base_command:
                 command.set("id", base_command.id)
         command_id = command.get("id")
@@ -101,15 +218,9 @@ class CommandParser:
                 f"Skipping - missing name or id {command_name} {command_id}")
             return False
 
-        if command_name in [
-                safe_get_attr(c, "name") for c in self.processed_commands
-        ]:
-            logger.debug(
-                f"Skipping - command already exists in processed commands {command_name}"
-            )
-            return False
-
-        if self._check_conformance_restrictions(command, command_name):
+        if children is None:
+            children = CommandChildren(command)
+        if self._check_conformance_restrictions(children, command_name):
             logger.debug(
                 f"Skipping - command {command_name} due to conformance restrictions"
             )
@@ -117,38 +228,33 @@ class CommandParser:
 
         return True
 
-    def _check_conformance_restrictions(self, command, command_name):
+    def _check_conformance_restrictions(self, children, command_name):
         """Check if the command has any conformance restrictions
 
-        :param command: The command element from the cluster XML file.
+        :param children: Child elements of the command element from the cluster XML file.
         :param command_name: returns: True if the command should be skipped, False otherwise.
         :returns: True if the command should be skipped, False otherwise.
 
         """
-        deprecate_conform = command.find("deprecateConform")
-        if deprecate_conform is not None:
+        if children.deprecate_conform is not None:
             logger.debug(f"Skipping - deprecated command {command_name}")
             return True
 
-        disallow_conform = command.find("disallowConform")
-        if disallow_conform is not None:
+        if children.disallow_conform is not None:
             logger.debug(f"Skipping - disallow conformance for {command_name}")
             return True
 
-        optional_conform = command.find("optionalConform")
-        if optional_conform is not None:
-            cond = optional_conform.find("condition")
-            if cond is not None and cond.get("name") == "Zigbee":
-                logger.debug(
-                    f"Skipping - Zigbee specific command {command_name}")
-                return True
+        if children.condition_name == "Zigbee":
+            logger.debug(f"Skipping - Zigbee specific command {command_name}")
+            return True
 
         return False
 
-    def _create_command(self, command):
+    def _create_command(self, command, children: CommandChildren):
         """Create a Command object
 
         :param command: returns: The created Command object.
+        :param children: Child elements of the command.
         :returns: The created Command object.
 
         """
@@ -158,20 +264,20 @@ class CommandParser:
             name=command_name,
             direction=command.get("direction"),
             response=command.get("response"),
-            is_mandatory=command.find("mandatoryConform") is not None,
+            is_mandatory=children.mandatory_conform is not None,
         )
-        if safe_get_attr(self.cluster, "command_handler_available"):
+        if self.cluster.command_handler_available:
             cmd.command_handler_available = True
         return cmd
 
-    def _process_command_access(self, cmd, command):
+    def _process_command_access(self, cmd, children):
         """Process command access
 
         :param cmd: The command object to process.
-        :param command: The command element from the cluster XML file.
+        :param children: Child elements of the command element from the cluster XML file.
 
         """
-        access_elem = command.find("access")
+        access_elem = children.access
         if access_elem is not None:
             cmd_access = Command.CommandAccess(
                 invokePrivilege=access_elem.get("invokePrivilege", None),
@@ -179,14 +285,14 @@ class CommandParser:
             )
             cmd.set_access(cmd_access)
 
-    def _process_command_fields(self, cmd, command):
+    def _process_command_fields(self, cmd, children):
         """Process command fields
 
         :param cmd: The command object to process.
-        :param command: The command element from the cluster XML file.
+        :param children: Child elements of the command element from the cluster XML file.
 
         """
-        for field_elem in command.findall("field"):
+        for field_elem in children.fields:
             field_id = field_elem.get("id")
             field_name = field_elem.get("name")
             field_type = field_elem.get("type")
@@ -198,60 +304,36 @@ class CommandParser:
 
             # Process field constraints
             constraint = None
-            constraint_elem = field_elem.find("constraint")
+            constraint_elem = find_first(_XP_CONSTRAINT, field_elem)
             if constraint_elem is not None:
                 constraint = {}
                 # Handle different constraint types
                 for child in constraint_elem:
-                    if child.tag == "maxLength":
-                        constraint["type"] = "maxLength"
-                        constraint["value"] = child.get("value")
-                    elif child.tag == "min":
-                        constraint["type"] = "min"
-                        constraint["value"] = child.get("value")
-                    elif child.tag == "max":
-                        constraint["type"] = "max"
-                        constraint["value"] = child.get("value")
-                    elif child.tag == "between":
-                        constraint["type"] = "between"
-                        from_elem = child.find("from")
-                        to_elem = child.find("to")
-
-                        if from_elem is not None and from_elem.get(
-                                "value") is not None:
-                            constraint["min"] = from_elem.get("value")
-                        else:
-                            constraint["min"] = "0"
-
-                        if to_elem is not None and to_elem.get(
-                                "value") is not None:
-                            constraint["max"] = to_elem.get("value")
-                        else:
-                            constraint["max"] = "0"
-                    elif child.tag == "desc":
-                        constraint["type"] = "desc"
-                        constraint["value"] = None
+                    handler = _CONSTRAINT_HANDLERS.get(child.tag)
+                    if handler is not None:
+                        handler(constraint, child)
 
             field = Command.CommandField(
                 id=field_id,
                 name=field_name,
                 type_=field_type,
                 default_value=field_default,
-                is_mandatory=field_elem.find("mandatoryConform") is not None,
+                is_mandatory=find_first(_XP_MANDATORY, field_elem)
+                is not None,
                 constraint=constraint,
             )
             cmd.add_field(field)
 
-    def _process_command_conformance(self, cmd, command):
+    def _process_command_conformance(self, cmd, children):
         """Process command conformance
 
         :param cmd: The command object to process.
-        :param command: The command element from the cluster XML file.
+        :param children: Child elements of the command element from the cluster XML file.
 
         """
-        mandatory_conform = command.find("mandatoryConform")
-        optional_conform = command.find("optionalConform")
-        otherwise_conform = command.find("otherwiseConform")
+        mandatory_conform = children.mandatory_conform
+        optional_conform = children.optional_conform
+        otherwise_conform = children.otherwise_conform
 
         if mandatory_conform is not None:
             cmd.conformance = parse_conformance(mandatory_conform,
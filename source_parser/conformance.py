@@ -12,15 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from utils.helper import convert_to_snake_case
-from utils.helper import safe_get_attr
 from utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Leaf condition dicts shared by every condition referencing the same name, they are never modified after parsing
+_ATTRIBUTE_NODES = {}
+_COMMAND_NODES = {}
+_FEATURE_NODES = {}
+
+# Conformance type of each conformance tag, any other tag is used as the type as is
+_TAG_TO_TYPE = {
+    "mandatoryConform": "mandatory",
+    "optionalConform": "optional",
+    "deprecateConform": "deprecated",
+    "disallowConform": "disallowed",
+}
+# Conformance tags allowed as the branches of an otherwiseConform
+_OTHERWISE_BRANCH_TAGS = frozenset([
+    "mandatoryConform",
+    "optionalConform",
+    "deprecateConform",
+    "disallowConform",
+])
+# Tags of the main condition of a conformance, other *Term tags are still accepted through a suffix check
+_MAIN_COND_TAGS = frozenset([
+    "andTerm",
+    "orTerm",
+    "notTerm",
+    "attribute",
+    "feature",
+    "command",
+])
+# Condition type of each logical term tag
+_TERM_MAP = {
+    "andTerm": "and",
+    "orTerm": "or",
+    "notTerm": "not",
+}
+
 
 class Conformance:
     """ """
 
+    __slots__ = ("type", "condition", "feature_map", "choice", "more", "min")
+
     def __init__(self):
         self.type = None  # mandatory, optional, otherwise, etc.
         self.condition = None  # Nested condition structure
@@ -37,8 +73,8 @@ class Conformance:
         :param attribute_map: Dictionary mapping attribute names to their IDs (Default value = None)
 
         """
-        result = {"type": safe_get_attr(self, "type")}
-        if safe_get_attr(self, "condition"):
+        result = {"type": self.type}
+        if self.condition:
             if attribute_map:
                 result[
                     "condition"] = self._replace_attribute_and_command_names(
@@ -47,11 +83,11 @@ class Conformance:
                 result["condition"] = self.condition
 
         # Add optional conformance attributes if they exist
-        if safe_get_attr(self, "choice"):
+        if self.choice:
             result["choice"] = self.choice
-        if safe_get_attr(self, "more"):
+        if self.more:
             result["more"] = self.more
-        if safe_get_attr(self, "min"):
+        if self.min:
             result["min"] = self.min
 
         return result
@@ -129,39 +165,30 @@ def parse_conformance(conformance_elem, feature_map):
         return None
     conformance = Conformance()
     conformance.feature_map = feature_map
-    if conformance_elem.tag == "mandatoryConform":
-        conformance.type = "mandatory"
-    elif conformance_elem.tag == "optionalConform":
-        conformance.type = "optional"
+    conformance.type = _TAG_TO_TYPE.get(conformance_elem.tag,
+                                        conformance_elem.tag)
+    if conformance_elem.tag == "optionalConform":
         # Extract optional conformance attributes if present
-        if conformance_elem.get("choice"):
-            conformance.choice = conformance_elem.get("choice")
-        if conformance_elem.get("more"):
+        choice = conformance_elem.get("choice")
+        if choice:
+            conformance.choice = choice
+        more = conformance_elem.get("more")
+        if more:
             # Convert string to boolean for 'more' attribute
-            conformance.more = conformance_elem.get("more").lower() == "true"
-        if conformance_elem.get("min"):
+            conformance.more = more.lower() == "true"
+        min_value = conformance_elem.get("min")
+        if min_value:
             # Convert string to integer for 'min' attribute
             try:
-                conformance.min = int(conformance_elem.get("min"))
-            except (ValueError, TypeError):
+                conformance.min = int(min_value)
+            except ValueError:
                 logger.warning(
-                    f"Invalid min value in optionalConform: {conformance_elem.get('min')}"
-                )
+                    f"Invalid min value in optionalConform: {min_value}")
                 # Keep as string if conversion fails
-                conformance.min = conformance_elem.get("min")
-    elif conformance_elem.tag == "deprecateConform":
-        conformance.type = "deprecated"
-    elif conformance_elem.tag == "disallowConform":
-        conformance.type = "disallowed"
-    else:
-        conformance.type = conformance_elem.tag
+                conformance.min = min_value
 
     for child in conformance_elem:
-        if child.tag.endswith("Term") or child.tag in [
-                "attribute",
-                "feature",
-                "command",
-        ]:
+        if child.tag in _MAIN_COND_TAGS or child.tag.endswith("Term"):
             conformance.condition = _parse_condition(child, feature_map)
             break  # We only expect one main condition
     return conformance
@@ -183,36 +210,31 @@ def parse_otherwise_conformance(otherwise_elem, feature_map):
 
     sub_conditions = {}
     for child in otherwise_elem:
-        if child.tag in [
-                "mandatoryConform",
-                "optionalConform",
-                "deprecateConform",
-                "disallowConform",
-        ]:
+        if child.tag in _OTHERWISE_BRANCH_TAGS:
             child_type = child.tag.replace("Conform", "")
             sub_condition = {}
 
             # Handle optional conformance attributes for nested optionalConform
             if child.tag == "optionalConform":
-                if child.get("choice"):
-                    sub_condition["choice"] = child.get("choice")
-                if child.get("more"):
-                    sub_condition["more"] = child.get("more").lower() == "true"
-                if child.get("min"):
+                choice = child.get("choice")
+                if choice:
+                    sub_condition["choice"] = choice
+                more = child.get("more")
+                if more:
+                    sub_condition["more"] = more.lower() == "true"
+                min_value = child.get("min")
+                if min_value:
                     try:
-                        sub_condition["min"] = int(child.get("min"))
-                    except (ValueError, TypeError):
+                        sub_condition["min"] = int(min_value)
+                    except ValueError:
                         logger.warning(
-                            f"Invalid min value in nested optionalConform: {child.get('min')}"
+                            f"Invalid min value in nested optionalConform: {min_value}"
                         )
-                        sub_condition["min"] = child.get("min")
+                        sub_condition["min"] = min_value
 
             for subchild in child:
-                if subchild.tag.endswith("Term") or subchild.tag in [
-                        "attribute",
-                        "feature",
-                        "command",
-                ]:
+                if (subchild.tag in _MAIN_COND_TAGS
+                        or subchild.tag.endswith("Term")):
                     parsed_condition = _parse_condition(subchild, feature_map)
                     if parsed_condition:
                         # Merge the parsed condition with any existing attributes
@@ -239,25 +261,33 @@ def _parse_condition(elem, feature_map):
     if elem is None:
         return None
     if elem.tag == "attribute":
-        return {"attribute": elem.get("name")}
+        name = elem.get("name")
+        node = _ATTRIBUTE_NODES.get(name)
+        if node is None:
+            node = _ATTRIBUTE_NODES[name] = {"attribute": name}
+        return node
     if elem.tag == "command":
-        return {"command": elem.get("name")}
+        name = elem.get("name")
+        node = _COMMAND_NODES.get(name)
+        if node is None:
+            node = _COMMAND_NODES[name] = {"command": name}
+        return node
 
     if elem.tag == "feature":
         feature_code = elem.get("name")
-        if feature_code in feature_map.keys():
-            return {
-                "feature":
-                convert_to_snake_case(feature_map[feature_code].name)
-            }
+        if feature_code in feature_map:
+            name = convert_to_snake_case(feature_map[feature_code].name)
+            node = _FEATURE_NODES.get(name)
+            if node is None:
+                node = _FEATURE_NODES[name] = {"feature": name}
+            return node
         else:
             logger.error(f"Feature {feature_code} not found in feature map")
             # Return error code instead of continuing with a conformance object
             return None  # Returning None indicates the feature wasn't found
 
-    condition_type = elem.tag
-    if condition_type.endswith("Term"):
-        condition_type = condition_type.replace("Term", "")
+    # Any other tag is not a supported condition and gives None below
+    condition_type = _TERM_MAP.get(elem.tag)
 
     if condition_type in ["and", "or"]:
         subconditions = []
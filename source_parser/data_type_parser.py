@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from utils.attribute_type import attribute_types
-from utils.helper import safe_get_attr
 from utils.logger import setup_logger
 
 logger = setup_logger()
@@ -21,6 +20,8 @@ logger = setup_logger()
 class Item:
     """ """
 
+    __slots__ = ("name", "value", "summary", "is_mandatory")
+
     def __init__(self, name, value, summary, is_mandatory):
         self.name = name
         self.value = value
@@ -40,6 +41,8 @@ class Item:
 class Enum:
     """ """
 
+    __slots__ = ("name", "base_type", "items")
+
     def __init__(self, name, base_type, items):
         self.name: str = name
         self.base_type: str = base_type
@@ -57,6 +60,8 @@ class Enum:
 class Bitmap:
     """ """
 
+    __slots__ = ("name", "base_type", "bitfields")
+
     def __init__(self, name, base_type, bitfields):
         self.name: str = name
         self.base_type: str = base_type
@@ -74,6 +79,8 @@ class Bitmap:
 class Struct:
     """ """
 
+    __slots__ = ("name", "base_type", "fields")
+
     def __init__(self, name, base_type, fields):
         self.name: str = name
         self.base_type: str = base_type
@@ -91,8 +98,12 @@ class Struct:
 class DataTypeParser:
     """ """
 
+    __slots__ = ("attribute_types", "enums", "bitmaps", "structs")
+
     def __init__(self):
-        self.attribute_types = attribute_types
+        # Copy of the default types, the data types of the parsed file are added to it and not to the shared
+        # module level dict, so the types of a file do not depend on which files the process parsed before
+        self.attribute_types = dict(attribute_types)
         self.enums = {}
         self.bitmaps = {}
         self.structs = {}
@@ -104,48 +115,53 @@ class DataTypeParser:
         :returns: A dictionary of data types.
 
         """
+        attribute_types = self.attribute_types
         data_types = root.find("dataTypes")
         if data_types is not None:
             # Parse enums - count items
-            for enum in data_types.findall("enum"):
+            for enum in data_types.iterchildren("enum"):
                 enum_name = enum.get("name").lower()
-                attribute_types[enum_name] = self.get_enum_type(enum)
+                items = [
+                    Item(
+                        item.get("name"),
+                        item.get("value"),
+                        item.get("summary"),
+                        item.find("mandatoryConform") is not None,
+                    ) for item in enum.iterchildren("item")
+                ]
+                # The type is inferred from the items already collected instead of counting them again
+                attribute_types[enum_name] = self.get_enum_type(len(items))
 
                 # Store complete enum information
                 self.enums[enum_name] = Enum(
                     enum.get("name"),
                     attribute_types[enum_name],
-                    [
-                        Item(
-                            item.get("name"),
-                            item.get("value"),
-                            item.get("summary"),
-                            item.find("mandatoryConform") is not None,
-                        ) for item in enum.findall("item")
-                    ],
+                    items,
                 )
 
             # Parse bitmaps - check highest bit position
-            for bitmap in data_types.findall("bitmap"):
+            for bitmap in data_types.iterchildren("bitmap"):
                 bitmap_name = bitmap.get("name").lower()
-                attribute_types[bitmap_name] = self.get_bitmap_type(bitmap)
+                bitfields = [
+                    Item(
+                        bitfield.get("name"),
+                        bitfield.get("bit"),
+                        bitfield.get("summary"),
+                        bitfield.find("mandatoryConform") is not None,
+                    ) for bitfield in bitmap.iterchildren("bitfield")
+                ]
+                attribute_types[bitmap_name] = self.get_bitmap_type(
+                    len(bitfields))
 
                 # Store complete bitmap information
                 self.bitmaps[bitmap_name] = Bitmap(
                     bitmap.get("name"),
                     attribute_types[bitmap_name],
-                    [
-                        Item(
-                            safe_get_attr(bitfield, "name"),
-                            safe_get_attr(bitfield, "bit"),
-                            safe_get_attr(bitfield, "summary"),
-                            bitfield.find("mandatoryConform") is not None,
-                        ) for bitfield in bitmap.findall("bitfield")
-                    ],
+                    bitfields,
                 )
 
             # Parse structs - check number of fields
-            for struct in data_types.findall("struct"):
+            for struct in data_types.iterchildren("struct"):
                 struct_name = struct.get("name").lower()
                 attribute_types[struct_name] = "list"
 
@@ -155,24 +171,23 @@ class DataTypeParser:
                     "list",
                     [
                         Item(
-                            safe_get_attr(field, "name"),
-                            safe_get_attr(field, "type"),
-                            safe_get_attr(field, "summary"),
+                            field.get("name"),
+                            field.get("type"),
+                            field.get("summary"),
                             field.find("mandatoryConform") is not None,
-                        ) for field in struct.findall("field")
+                        ) for field in struct.iterchildren("field")
                     ],
                 )
 
         return attribute_types
 
-    def get_enum_type(self, enum_element):
+    def get_enum_type(self, item_count):
         """Infer enum type based on number of items
 
-        :param enum_element: returns: The enum type.
+        :param item_count: Number of items of the enum.
         :returns: The enum type.
 
         """
-        item_count = len(enum_element.findall("item"))
         if item_count <= 255:
             return "enum8"
         elif item_count <= 65535:
@@ -180,14 +195,13 @@ class DataTypeParser:
         else:
             return "enum32"
 
-    def get_bitmap_type(self, bitmap_element):
+    def get_bitmap_type(self, max_bit):
         """Infer bitmap type based on highest bit position
 
-        :param bitmap_element: returns: The bitmap type.
+        :param max_bit: Number of bitfields of the bitmap.
         :returns: The bitmap type.
 
         """
-        max_bit = len(bitmap_element.findall("bitfield"))
         if max_bit < 8:
             return "bitmap8"
         elif max_bit < 16:
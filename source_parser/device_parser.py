@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
 
 from source_parser.elements import Cluster
 from source_parser.elements import Device
@@ -20,6 +20,7 @@ from utils.helper import convert_to_snake_case
 from utils.helper import esp_name
 from utils.helper import safe_get_attr
 from utils.logger import setup_logger
+from utils.xml_utils import parse_xml_file
 
 logger = setup_logger()
 
@@ -27,6 +28,13 @@ logger = setup_logger()
 class DeviceParser:
     """ """
 
+    def __init__(self, parser=None):
+        """
+        :param parser: lxml XMLParser used for all the files, the shared parser of the current thread if None.
+                       lxml parsers cannot be pickled, so leave it None when the instance is sent to worker processes.  (Default value = None)
+        """
+        self.parser = parser
+
     def parse_device_file(self, file_path):
         """Parse a device XML file and return the parsed device object.
 
@@ -35,8 +43,7 @@ class DeviceParser:
 
         """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            root = parse_xml_file(file_path, self.parser)
         except ET.ParseError as e:
             logger.error(f"XML parsing error in {file_path}: {str(e)}")
             return None
@@ -52,7 +59,7 @@ class DeviceParser:
             return None
         device_revision = root.get("revision")
 
-        if not self._should_process_device(root):
+        if not self._should_process_device(device_name, device_id):
             return None
 
         device = Device(id=device_id,
@@ -71,35 +78,6 @@ class DeviceParser:
         )
         return device
 
-    def _parse_choice_groups(self, clusters_element):
-        """Parses the choice groups from the clusters element.
-        Choice groups are optional conformance rules that specify a minimum number of clusters that must be supported.
-        If a choice group is present, the first cluster in the group is marked as mandatory.
-
-        :param clusters_element: The root element of the clusters element.
-        :type clusters_element: Element
-        :returns: A dictionary of choice groups, where each key is a choice name and the value is a dictionary containing the clusters in the group.
-        :rtype: dict
-
-        """
-        choice_groups = {}
-        for cluster in clusters_element.findall("cluster"):
-            optional_conform = cluster.find("optionalConform")
-            if optional_conform is not None:
-                choice = optional_conform.get("choice")
-                if choice:
-                    if choice not in choice_groups:
-                        choice_groups[choice] = {
-                            "clusters": [],
-                            "min": int(optional_conform.get("min", "0")),
-                            "more": optional_conform.get("more") == "true",
-                        }
-                    cluster_id = cluster.get("id")
-                    cluster_name = cluster.get("name")
-                    choice_groups[choice]["clusters"].append(
-                        (cluster_id, cluster_name, cluster))
-        return choice_groups
-
     def _parse_clusters(self, device, root, file_path):
         """Parse the clusters from the device XML file.
 
@@ -114,10 +92,7 @@ class DeviceParser:
             command_name_list = []
             event_name_list = []
 
-            choice_groups = self._parse_choice_groups(clusters_element)
-
-            # Now process each cluster
-            for cluster in clusters_element.findall("cluster"):
+            for cluster in clusters_element.iterchildren("cluster"):
                 cluster_id = cluster.get("id")
                 if not check_valid_id(cluster_id):
                     logger.warning(
@@ -135,8 +110,23 @@ class DeviceParser:
                 elif cluster_side == "client":
                     cluster_info.client_cluster = True
 
+                # Collect the children used below in a single pass, keeping the first of each tag as find() would
+                mandatory_conform = None
+                features = None
+                commands = None
+                for child in cluster:
+                    tag = child.tag
+                    if tag == "mandatoryConform":
+                        if mandatory_conform is None:
+                            mandatory_conform = child
+                    elif tag == "features":
+                        if features is None:
+                            features = child
+                    elif tag == "commands":
+                        if commands is None:
+                            commands = child
+
                 # Check for mandatory conformance
-                mandatory_conform = cluster.find("mandatoryConform")
                 if mandatory_conform is not None:
                     if mandatory_conform.find("condition") is None and len(mandatory_conform) == 0:
                         cluster_info.is_mandatory = True
@@ -146,10 +136,9 @@ class DeviceParser:
                     cluster_info.is_mandatory = False
 
                 # Parse cluster features
-                features = cluster.find("features")
                 feature_name_list = []
                 if features is not None:
-                    for feature in features.findall("feature"):
+                    for feature in features.iterchildren("feature"):
                         feature_name = feature.get("name")
                         mandatory_conform = feature.find("mandatoryConform")
                         if mandatory_conform is not None:
@@ -160,9 +149,8 @@ class DeviceParser:
 
                 # Parse cluster commands
                 command_name_list = []
-                commands = cluster.find("commands")
                 if commands is not None:
-                    for command in commands.findall("command"):
+                    for command in commands.iterchildren("command"):
                         command_name = command.get("name")
                         mandatory_conform = command.find("mandatoryConform")
                         if mandatory_conform is not None:
@@ -222,14 +210,14 @@ class DeviceParser:
                 }
                 device.conditions.append(condition_info)
 
-    def _should_process_device(self, root):
+    def _should_process_device(self, name, id):
         """Check if the device should be processed.
 
-        :param root: returns: True if the device should be processed, False otherwise.
+        :param name: The name of the device, as returned by _get_name_and_id.
+        :param id: The id of the device, as returned by _get_name_and_id.
         :returns: True if the device should be processed, False otherwise.
 
         """
-        name, id = self._get_name_and_id(root)
         if not name or not id:
             logger.warning(
                 f"Device has no name or id, (Either base device type or not supported yet)"
@@ -11,7 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from operator import attrgetter
+
 from source_parser.conformance import Conformance
+from source_parser.serializers import AttributeSerializer
+from source_parser.serializers import ClusterSerializer
+from source_parser.serializers import CommandFieldSerializer
+from source_parser.serializers import CommandSerializer
+from source_parser.serializers import DeviceSerializer
+from source_parser.serializers import EventSerializer
+from source_parser.serializers import FeatureSerializer
 from utils.attribute_type import AttributeType
 from utils.base_elements import *
 from utils.helper import safe_get_attr
@@ -20,6 +29,30 @@ from utils.mapping import callback_skip_list
 
 logger = setup_logger()
 
+# Sort keys of the element lists
+_ID_KEY = attrgetter("id_int")
+_ID_NAME_KEY = attrgetter("id_int", "name")
+# Attribute types left out of the basic attribute lists
+_NON_BASIC_TYPES = frozenset(["list", "string", "octstr"])
+# Default values meaning an empty string or octstr attribute
+_NULL_STRING_DEFAULTS = frozenset(["null", "NULL", "0"])
+# Default values meaning an empty list attribute
+_NULL_LIST_DEFAULTS = _NULL_STRING_DEFAULTS | {"empty"}
+# Invoke privileges of the commands that need a callback
+_CALLBACK_PRIVILEGES = frozenset(["operate", "admin", "manage"])
+
+
+def _plain_mandatory(element):
+    """Check if an attribute, command or event is mandatory without any conformance condition
+
+    :param element: The attribute, command or event to check.
+    :returns: True if the element is plain mandatory, False otherwise.
+
+    """
+    conformance = element.conformance
+    return (bool(element.is_mandatory) and conformance is not None
+            and conformance.condition is None)
+
 
 class Device(BaseDevice):
     """ """
@@ -65,8 +98,7 @@ class Device(BaseDevice):
     def get_clusters(self):
         """ """
         return sorted(self.clusters,
-                      key=lambda x:
-                      (int(x.get_id(), 16), not x.server_cluster))
+                      key=lambda x: (x.id_int, not x.server_cluster))
 
     def get_all_mandatory_clusters(self):
         """ """
@@ -76,8 +108,7 @@ class Device(BaseDevice):
             if cluster.mandatory_with_condition:
                 mandatory_clusters_with_condition.append(cluster)
         return sorted(mandatory_clusters_with_condition,
-                      key=lambda x:
-                      (int(x.get_id(), 16), not x.server_cluster))
+                      key=lambda x: (x.id_int, not x.server_cluster))
 
     def get_mandatory_clusters(self):
         """ """
@@ -86,25 +117,21 @@ class Device(BaseDevice):
             if cluster.is_mandatory:
                 mandatory_clusters.append(cluster)
         return sorted(mandatory_clusters,
-                      key=lambda x:
-                      (int(x.get_id(), 16), not x.server_cluster))
+                      key=lambda x: (x.id_int, not x.server_cluster))
 
     def get_unique_clusters(self):
         """ """
         unique_clusters_dict = {}
         for cluster in self.clusters:
-            cluster_id = safe_get_attr(cluster, "id")
+            cluster_id = cluster.id
             if cluster_id not in unique_clusters_dict:
                 unique_clusters_dict[cluster_id] = cluster
         unique_clusters = list(unique_clusters_dict.values())
         return sorted(unique_clusters,
-                      key=lambda x:
-                      (int(x.get_id(), 16), not x.server_cluster))
+                      key=lambda x: (x.id_int, not x.server_cluster))
 
     def to_dict(self):
         """Convert device object to dictionary representation"""
-        from source_parser.serializers import DeviceSerializer
-
         return DeviceSerializer.to_dict(self)
 
 
@@ -117,12 +144,7 @@ class Event(BaseEvent):
 
     def is_plain_mandatory(self) -> bool:
         """Check if the event is plain mandatory"""
-        if (self.is_mandatory
-                    and safe_get_attr(self, "conformance") is not None
-                    and safe_get_attr(safe_get_attr(self, "conformance"),
-                                      "condition") is None):
-            return True
-        return False
+        return _plain_mandatory(self)
 
     def to_dict(self, attribute_map=None):
         """Convert event object to dictionary representation
@@ -130,8 +152,6 @@ class Event(BaseEvent):
         :param attribute_map: Default value = None)
 
         """
-        from source_parser.serializers import EventSerializer
-
         return EventSerializer.to_dict(self, attribute_map)
 
 
@@ -148,6 +168,43 @@ class Feature(BaseFeature):
         self.event_set = set()
         self.summary = None
         self.conformance = None
+        # Choice details of the conformance, classified once in set_conformance
+        self.is_choice = False
+        self.choice_mandatory_dep = None
+
+    def set_conformance(self, conformance):
+        """Set the conformance of the feature and classify it as a choice feature or not.
+        A feature is a choice feature if it is optional with a choice, or if its otherwise conformance has an optional
+        branch with a choice, in which case the feature of the mandatory branch is its dependency.
+
+        :param conformance: The parsed conformance of the feature.
+
+        """
+        self.conformance = conformance
+        self.is_choice = False
+        self.choice_mandatory_dep = None
+        if not conformance:
+            return
+
+        # Check for direct optional conformance with choice
+        if conformance.type == "optional" and conformance.choice is not None:
+            self.is_choice = True
+
+        # Check for otherwise conformance with optional choice condition
+        elif (conformance.type == "otherwise"
+              and conformance.condition is not None):
+            condition = conformance.condition
+            if (isinstance(condition, dict) and "optional" in condition
+                    and isinstance(condition["optional"], dict)
+                    and "choice" in condition["optional"]):
+                self.is_choice = True
+
+                # Also check for mandatory dependencies within the same otherwise conformance
+                if "mandatory" in condition and isinstance(
+                        condition["mandatory"], dict):
+                    if "feature" in condition["mandatory"]:
+                        self.choice_mandatory_dep = condition["mandatory"][
+                            "feature"]
 
     def add_attribute_list(self, attributes: set):
         """Add only mandatory attributes to the feature
@@ -161,12 +218,11 @@ class Feature(BaseFeature):
 
     def get_basic_attributes(self):
         """Returns the list of mandatory attributes for this feature that are not lists, strings or octstrs"""
-        attr_list = []
-        for attr in self.attribute_set:
-            if attr.type not in ["list", "string", "octstr"]:
-                attr_list.append(attr)
-        if len(attr_list) > 0:
-            attr_list.sort(key=lambda x: int(x.get_id(), 16))
+        attr_list = [
+            attr for attr in self.attribute_set
+            if attr.type not in _NON_BASIC_TYPES
+        ]
+        attr_list.sort(key=_ID_KEY)
         return attr_list
 
     def add_event_list(self, events: set):
@@ -183,14 +239,14 @@ class Feature(BaseFeature):
         """Returns the list of mandatory attributes for this feature"""
         attr_list = list(self.attribute_set)
         if len(attr_list) > 0:
-            attr_list.sort(key=lambda x: int(x.get_id(), 16))
+            attr_list.sort(key=_ID_KEY)
         return attr_list
 
     def get_event_list(self):
         """Returns the list of mandatory events for this feature"""
         event_list = list(self.event_set)
         if len(event_list) > 0:
-            event_list.sort(key=lambda x: int(x.get_id(), 16))
+            event_list.sort(key=_ID_KEY)
         return event_list
 
     def add_command_list(self, commands):
@@ -206,7 +262,7 @@ class Feature(BaseFeature):
         """ """
         command_list = list(self.command_set)
         if len(command_list) > 0:
-            command_list.sort(key=lambda x: int(x.get_id(), 16))
+            command_list.sort(key=_ID_KEY)
         return command_list
 
     def to_dict(self, attribute_map=None):
@@ -215,8 +271,6 @@ class Feature(BaseFeature):
         :param attribute_map: Default value = None)
 
         """
-        from source_parser.serializers import FeatureSerializer
-
         return FeatureSerializer.to_dict(self, attribute_map)
 
 
@@ -231,9 +285,17 @@ class Command(BaseCommand):
         COMMAND_FLAG_ACCEPTED = "COMMAND_FLAG_ACCEPTED"
         COMMAND_FLAG_GENERATED = "COMMAND_FLAG_GENERATED"
 
+    # Flag of each lowercased command direction, any other direction has no flag
+    _DIRECTION_FLAGS = {
+        "commandtoserver": CommandFlags.COMMAND_FLAG_ACCEPTED,
+        "responsefromserver": CommandFlags.COMMAND_FLAG_GENERATED,
+    }
+
     class CommandAccess:
         """ """
 
+        __slots__ = ("invokePrivilege", "timed")
+
         def __init__(self, invokePrivilege, timed):
             self.invokePrivilege = invokePrivilege
             self.timed = timed
@@ -241,6 +303,9 @@ class Command(BaseCommand):
     class CommandField:
         """ """
 
+        __slots__ = ("id", "name", "type", "default_value", "is_mandatory",
+                     "constraint")
+
         def __init__(
             self,
             id,
@@ -259,14 +324,24 @@ class Command(BaseCommand):
 
         def to_dict(self):
             """Convert field to dictionary representation"""
-            from source_parser.serializers import CommandFieldSerializer
-
             return CommandFieldSerializer.to_dict(self)
 
+    __slots__ = (
+        "feature_list",
+        "access",
+        "conformance",
+        "fields",
+        "feature_map",
+        "multi_cluster_command",
+        "command_handler_available",
+        "direction_lower",
+    )
+
     def __init__(self, id, name, direction, response, is_mandatory):
+        # "Foo Command" is named "Foo", only the first two words matter
+        parts = name.split(" ", 2)
         super().__init__(
-            (name.split(" ")[0] if len(name.split(" ")) > 1
-             and name.split(" ")[1] == "Command" else name),
+            (parts[0] if len(parts) > 1 and parts[1] == "Command" else name),
             id,
             is_mandatory,
             direction,
@@ -281,6 +356,9 @@ class Command(BaseCommand):
         # if command is present in a cluster file with multiple cluster ids e.g. ResourceMonitoring
         self.multi_cluster_command = False
         self.command_handler_available = False
+        # The direction is only compared case insensitively, so it is lowercased once
+        self.direction_lower = (direction.lower()
+                                if direction is not None else None)
 
     def set_access(self, access):
         """
@@ -308,11 +386,8 @@ class Command(BaseCommand):
 
     def get_flag(self):
         """ """
-        if self.direction and self.direction.lower() == "commandtoserver":
-            return self.CommandFlags.COMMAND_FLAG_ACCEPTED
-        elif self.direction and self.direction.lower() == "responsefromserver":
-            return self.CommandFlags.COMMAND_FLAG_GENERATED
-        return self.CommandFlags.COMMAND_FLAG_NONE
+        return self._DIRECTION_FLAGS.get(self.direction_lower,
+                                         self.CommandFlags.COMMAND_FLAG_NONE)
 
     def callback_required(self):
         """Determine if a command requires a callback based on:
@@ -333,17 +408,16 @@ class Command(BaseCommand):
             return False
 
         # Skip callbacks for client-bound commands
-        if self.direction is not None and self.direction.lower(
-        ) != "commandtoserver":
+        if (self.direction_lower is not None
+                and self.direction_lower != "commandtoserver"):
             return False
 
         # Commands with access privileges typically need callbacks
-        if safe_get_attr(self, "access") is not None:
-            invoke_privilege = safe_get_attr(safe_get_attr(self, "access"),
-                                             "invokePrivilege")
+        if self.access is not None:
+            invoke_privilege = self.access.invokePrivilege
 
             # Commands with operate/admin/manage privileges or timed=true need callbacks
-            if invoke_privilege not in ["operate", "admin", "manage"]:
+            if invoke_privilege not in _CALLBACK_PRIVILEGES:
                 return False
 
         # Commands with response='Y' or specific response commands need callbacks
@@ -358,12 +432,7 @@ class Command(BaseCommand):
 
     def is_plain_mandatory(self) -> bool:
         """Check if the attribute is plain mandatory"""
-        if (self.is_mandatory
-                    and safe_get_attr(self, "conformance") is not None
-                    and safe_get_attr(safe_get_attr(self, "conformance"),
-                                      "condition") is None):
-            return True
-        return False
+        return _plain_mandatory(self)
 
     def to_dict(self, attribute_map=None):
         """Convert command object to dictionary representation
@@ -371,8 +440,6 @@ class Command(BaseCommand):
         :param attribute_map: Default value = None)
 
         """
-        from source_parser.serializers import CommandSerializer
-
         return CommandSerializer.to_dict(self, attribute_map)
 
 
@@ -397,6 +464,8 @@ class Attribute(BaseAttribute):
     class Access:
         """ """
 
+        __slots__ = ("read", "readPrivilege", "write", "writePrivilege")
+
         def __init__(self, read, readPrivilege, write, writePrivilege):
             self.read = read
             self.readPrivilege = readPrivilege
@@ -406,6 +475,16 @@ class Attribute(BaseAttribute):
     class Quality:
         """ """
 
+        __slots__ = (
+            "changeOmitted",
+            "nullable",
+            "scene",
+            "persistence",
+            "reportable",
+            "sourceAttribution",
+            "quieterReporting",
+        )
+
         def __init__(
             self,
             changeOmitted,
@@ -427,6 +506,8 @@ class Attribute(BaseAttribute):
     class Constraint:
         """ """
 
+        __slots__ = ("type", "from_", "to_", "value")
+
         def __init__(self, type, from_, to_, value):
             self.type = type
             self.from_ = from_
@@ -487,35 +568,28 @@ class Attribute(BaseAttribute):
 
         self.internally_managed = False
 
-        self.is_nullable = (
-            True if safe_get_attr(self, "quality")
-            and safe_get_attr(safe_get_attr(self, "quality"), "nullable")
-            and safe_get_attr(safe_get_attr(self, "quality"),
-                              "nullable").lower() == "true" else False)
+        # Flags of the access and quality strings, evaluated once for get_flag
+        self.is_nullable = bool(quality and quality.nullable
+                                and quality.nullable.lower() == "true")
+        self.is_nonvolatile = bool(
+            quality and quality.persistence
+            and quality.persistence.lower() == "nonvolatile")
+        self.is_writable = bool(
+            access and access.write
+            and access.write.lower() in ("true", "optional"))
 
     def get_flag(self):
         """Get the flags of the attribute"""
         flags = []
-        if safe_get_attr(self, "access"):
-            if safe_get_attr(safe_get_attr(self, "access"), "write") and (
-                    safe_get_attr(safe_get_attr(self, "access"),
-                                  "write").lower() == "true"
-                    or safe_get_attr(safe_get_attr(self, "access"),
-                                     "write").lower() == "optional"):
-                flags.append(self.AttributeFlags.ATTRIBUTE_FLAG_WRITABLE)
-            if safe_get_attr(self, "internally_managed"):
-                flags.append(
-                    self.AttributeFlags.ATTRIBUTE_FLAG_MANAGED_INTERNALLY)
-
-        if safe_get_attr(self, "quality"):
-            if (safe_get_attr(safe_get_attr(self, "quality"), "nullable")
-                    and safe_get_attr(safe_get_attr(self, "quality"),
-                                      "nullable").lower() == "true"):
-                flags.append(self.AttributeFlags.ATTRIBUTE_FLAG_NULLABLE)
-            if (safe_get_attr(safe_get_attr(self, "quality"), "persistence")
-                    and safe_get_attr(safe_get_attr(self, "quality"),
-                                      "persistence").lower() == "nonvolatile"):
-                flags.append(self.AttributeFlags.ATTRIBUTE_FLAG_NONVOLATILE)
+        if self.is_writable:
+            flags.append(self.AttributeFlags.ATTRIBUTE_FLAG_WRITABLE)
+        # Only attributes with access details are reported as internally managed
+        if self.internally_managed and self.access:
+            flags.append(self.AttributeFlags.ATTRIBUTE_FLAG_MANAGED_INTERNALLY)
+        if self.is_nullable:
+            flags.append(self.AttributeFlags.ATTRIBUTE_FLAG_NULLABLE)
+        if self.is_nonvolatile:
+            flags.append(self.AttributeFlags.ATTRIBUTE_FLAG_NONVOLATILE)
         if len(flags) == 0:
             return self.AttributeFlags.ATTRIBUTE_FLAG_NONE
         return " | ".join(flags)
@@ -543,38 +617,27 @@ class Attribute(BaseAttribute):
             return "1" if self.default_value.lower() == "true" else "0"
 
         if self.type == "string" or self.type == "octstr":
-            if (safe_get_attr(self, "constraint") is not None
-                    and safe_get_attr(safe_get_attr(self, "constraint"),
-                                      "type") == "maxLength"
-                    and safe_get_attr(safe_get_attr(self, "constraint"),
-                                      "value") is not None):
-                return int(
-                    safe_get_attr(safe_get_attr(self, "constraint"), "value"))
-            if self.default_value is not None and self.default_value in [
-                    "null",
-                    "NULL",
-                    "0",
-            ]:
+            constraint = self.constraint
+            if (constraint is not None and constraint.type == "maxLength"
+                    and constraint.value is not None):
+                return int(constraint.value)
+            if (self.default_value is not None
+                    and self.default_value in _NULL_STRING_DEFAULTS):
                 return 0
             return 0
 
         if self.type == "list":
-            if (safe_get_attr(self, "constraint") is not None and
-                    safe_get_attr(safe_get_attr(self, "constraint"), "value")
-                    and safe_get_attr(safe_get_attr(self, "constraint"),
-                                      "value").isdigit()):
-                return int(
-                    safe_get_attr(safe_get_attr(self, "constraint"), "value"))
-            if self.default_value is not None and self.default_value in [
-                    "null",
-                    "NULL",
-                    "0",
-                    "empty",
-            ]:
+            constraint = self.constraint
+            if (constraint is not None and constraint.value
+                    and constraint.value.isdigit()):
+                return int(constraint.value)
+            if (self.default_value is not None
+                    and self.default_value in _NULL_LIST_DEFAULTS):
                 return 0
             return 0
 
-        if "enum" in self.type.lower() or "bitmap" in self.type.lower():
+        type_lower = self.type.lower()
+        if "enum" in type_lower or "bitmap" in type_lower:
             if self.default_value is not None:
                 if self.default_value.isdigit():
                     return int(self.default_value)
@@ -582,23 +645,29 @@ class Attribute(BaseAttribute):
                     return int(self.default_value, 16)
             return "0"
 
-        if self.default_value is not None and "°" in self.default_value:  # for temperatures
-            default_value = self.default_value.split("°")[0]
-            if default_value.isdigit():
-                return int(default_value) * 100
+        default_value = self.default_value
+        if default_value is None:
+            # if default value is missing
+            constraint = self.constraint
+            if (constraint is not None and constraint.value
+                    and constraint.value.isdigit()):
+                return int(constraint.value)
+            return "0"
+
+        if "°" in default_value:  # for temperatures
+            temperature = default_value.partition("°")[0]
+            if temperature.isdigit():
+                return int(temperature) * 100
             return 0
 
-        # for types '123 (0.233)' etc.
-        if self.default_value is not None and not self.default_value.isdigit():
-            if self.default_value.split(" ")[0].isdigit():
-                return int(self.default_value.split(" ")[0])
+        if default_value.isdigit():
+            return int(default_value)
 
-        if (self.default_value is None and self.constraint is not None
-                and self.constraint.value and self.constraint.value.isdigit()
-            ):  # if default value is missing
-            return int(self.constraint.value)
-        return (int(self.default_value) if self.default_value
-                and self.default_value.isdigit() else "0")
+        # for types '123 (0.233)' etc.
+        leading_value = default_value.partition(" ")[0]
+        if leading_value.isdigit():
+            return int(leading_value)
+        return "0"
 
     def get_max_value(self):
         """Get the max value of the attribute"""
@@ -610,12 +679,7 @@ class Attribute(BaseAttribute):
 
     def is_plain_mandatory(self) -> bool:
         """Check if the attribute is plain mandatory"""
-        if (self.is_mandatory
-                    and safe_get_attr(self, "conformance") is not None
-                    and safe_get_attr(safe_get_attr(self, "conformance"),
-                                      "condition") is None):
-            return True
-        return False
+        return _plain_mandatory(self)
 
     def to_dict(self, attribute_map=None):
         """Convert attribute object to dictionary representation
@@ -623,8 +687,6 @@ class Attribute(BaseAttribute):
         :param attribute_map: Default value = None)
 
         """
-        from source_parser.serializers import AttributeSerializer
-
         return AttributeSerializer.to_dict(self, attribute_map)
 
 
@@ -642,6 +704,26 @@ class Cluster(BaseCluster):
         CLUSTER_FLAG_SERVER = "CLUSTER_FLAG_SERVER"
         CLUSTER_FLAG_CLIENT = "CLUSTER_FLAG_CLIENT"
 
+    __slots__ = (
+        "attributes",
+        "commands",
+        "events",
+        "features",
+        "conformance",
+        "revision_history",
+        "data_types",
+        "attribute_types",
+        "hierarchy",
+        "pics_code",
+        "scope",
+        "base_cluster_name",
+        "mandatory_with_condition",
+        # Set on the clusters of a device type by the device parser
+        "feature_name_list",
+        "command_name_list",
+        "event_name_list",
+    )
+
     def __init__(self, name, id, revision):
         super().__init__(name, id, revision, is_mandatory=False)
         self.attributes: set[Attribute] = set()
@@ -662,25 +744,25 @@ class Cluster(BaseCluster):
     def get_attribute_list(self):
         """Get all attributes sorted by attribute id, then by name if ids match"""
         cluster_attributes = list(self.attributes)
-        cluster_attributes.sort(key=lambda x: (int(x.get_id(), 16), x.name))
+        cluster_attributes.sort(key=_ID_NAME_KEY)
         return cluster_attributes
 
     def get_command_list(self):
         """Get all commands sorted by command id, then by name if ids match"""
         cluster_commands = list(self.commands)
-        cluster_commands.sort(key=lambda x: (int(x.get_id(), 16), x.name))
+        cluster_commands.sort(key=_ID_NAME_KEY)
         return cluster_commands
 
     def get_event_list(self):
         """Get all events sorted by event id, then by name if ids match"""
         cluster_events = list(self.events)
-        cluster_events.sort(key=lambda x: (int(x.get_id(), 16), x.name))
+        cluster_events.sort(key=_ID_NAME_KEY)
         return cluster_events
 
     def get_feature_list(self):
         """Get all features sorted by feature id"""
         cluster_features = list(self.features)
-        cluster_features.sort(key=lambda x: int(x.get_id(), 16))
+        cluster_features.sort(key=_ID_KEY)
         return cluster_features
 
     def get_feature_choice_list(self) -> list[Feature]:
@@ -690,99 +772,50 @@ class Cluster(BaseCluster):
         :returns: A list of features with optional conformance and choice attributes sorted by feature id.
 
         """
-        choice_features = []
-        dependent_features = set(
-        )  # Features that are dependencies of choice features
-
-        for feature in self.features:
-            conformance = safe_get_attr(feature, "conformance")
-            is_choice_feature = False
-
-            # Check for direct optional conformance with choice
-            if (conformance
-                    and safe_get_attr(conformance, "type") == "optional"
-                    and safe_get_attr(conformance, "choice") is not None):
-                choice_features.append(feature)
-                is_choice_feature = True
-
-            # Check for otherwise conformance with optional choice condition
-            elif (conformance
-                  and safe_get_attr(conformance, "type") == "otherwise"
-                  and safe_get_attr(conformance, "condition") is not None):
-                condition = safe_get_attr(conformance, "condition")
-                if (isinstance(condition, dict) and "optional" in condition
-                        and isinstance(condition["optional"], dict)
-                        and "choice" in condition["optional"]):
-                    choice_features.append(feature)
-                    is_choice_feature = True
-
-                    # Also check for mandatory dependencies within the same otherwise conformance
-                    if "mandatory" in condition and isinstance(
-                            condition["mandatory"], dict):
-                        if "feature" in condition["mandatory"]:
-                            feature_name = condition["mandatory"]["feature"]
-                            dependent_features.add(feature_name)
-
-        # Find the actual feature objects for the dependent features
-        for feature in self.features:
-            feature_func_name = safe_get_attr(feature, "func_name", "")
-            if feature_func_name in dependent_features:
-                choice_features.append(feature)
-
-        # Remove duplicates while preserving order
-        unique_choice_features = []
-        seen = set()
-        for feature in choice_features:
-            if feature not in seen:
-                unique_choice_features.append(feature)
-                seen.add(feature)
-
-        if len(unique_choice_features) > 0:
-            unique_choice_features.sort(key=lambda x: int(x.get_id(), 16))
-        return unique_choice_features
+        choice_features = [
+            feature for feature in self.features if feature.is_choice
+        ]
+        # Features that are dependencies of choice features
+        dependent_features = set(feature.choice_mandatory_dep
+                                 for feature in choice_features
+                                 if feature.choice_mandatory_dep is not None)
+
+        # Find the actual feature objects for the dependent features, the choice features are already in the list
+        if dependent_features:
+            choice_features.extend(
+                feature for feature in self.features
+                if feature.func_name in dependent_features
+                and not feature.is_choice)
+
+        choice_features.sort(key=_ID_KEY)
+        return choice_features
 
     def get_mandatory_attributes(self):
         """Get only mandatory attributes from the attribute list"""
         """note: This also includes the mandatory attributes with conformance conditions as either not or which has conformance condition string as None"""
-        mandatory_attributes = []
-        for attribute in self.attributes:
-            if (attribute.is_mandatory
-                    and safe_get_attr(attribute, "conformance") is not None
-                    and safe_get_attr(safe_get_attr(attribute, "conformance"),
-                                      "condition") is None):
-                mandatory_attributes.append(attribute)
-        if len(mandatory_attributes) > 0:
-            mandatory_attributes.sort(
-                key=lambda x: (int(x.get_id(), 16), x.name))
+        mandatory_attributes = [
+            attribute for attribute in self.attributes
+            if _plain_mandatory(attribute)
+        ]
+        mandatory_attributes.sort(key=_ID_NAME_KEY)
         return mandatory_attributes
 
     def get_mandatory_commands(self):
         """Get only mandatory commands from the command list"""
         """note: This also includes the mandatory commands with conformance conditions as either not or which has conformance condition string as None"""
-        mandatory_commands = []
-        for command in self.commands:
-            if (command.is_mandatory
-                    and safe_get_attr(command, "conformance") is not None
-                    and safe_get_attr(safe_get_attr(command, "conformance"),
-                                      "condition") is None):
-                mandatory_commands.append(command)
-        if len(mandatory_commands) > 0:
-            mandatory_commands.sort(
-                key=lambda x: (int(x.get_id(), 16), x.name))
+        mandatory_commands = [
+            command for command in self.commands if _plain_mandatory(command)
+        ]
+        mandatory_commands.sort(key=_ID_NAME_KEY)
         return mandatory_commands
 
     def get_mandatory_events(self):
         """Get only mandatory events from the event list"""
         """note: This also includes the mandatory events with conformance conditions as either not or which has conformance condition string as None"""
-        mandatory_events = []
-        for event in self.events:
-            if (event.is_mandatory
-                    and safe_get_attr(event, "conformance") is not None
-                    and safe_get_attr(safe_get_attr(event, "conformance"),
-                                      "condition") is None):
-                mandatory_events.append(event)
-        if len(mandatory_events) > 0:
-            mandatory_events.sort(key=lambda x: (int(x.get_id(), 16), x.name))
+        mandatory_events = [
+            event for event in self.events if _plain_mandatory(event)
+        ]
+        mandatory_events.sort(key=_ID_NAME_KEY)
         return mandatory_events
 
     def get_mandatory_features(self):
@@ -792,11 +825,13 @@ class Cluster(BaseCluster):
 
     def get_basic_mandatory_attributes(self):
         """Get only mandatory attributes from the attribute list that are not list, string, or octstr"""
-        basic_mandatory_attributes = list(
-            attribute for attribute in self.get_mandatory_attributes()
-            if attribute.type not in ["list", "string", "octstr"])
-        if len(basic_mandatory_attributes) > 0:
-            basic_mandatory_attributes.sort(key=lambda x: int(x.get_id(), 16))
+        # Same id then name order as get_mandatory_attributes, a stable re-sort by id alone would not change it
+        basic_mandatory_attributes = [
+            attribute for attribute in self.attributes
+            if attribute.type not in _NON_BASIC_TYPES
+            and _plain_mandatory(attribute)
+        ]
+        basic_mandatory_attributes.sort(key=_ID_NAME_KEY)
         return basic_mandatory_attributes
 
     def get_function_flags(self):
@@ -830,6 +865,4 @@ class Cluster(BaseCluster):
 
     def to_dict(self):
         """Convert cluster object to dictionary representation"""
-        from source_parser.serializers import ClusterSerializer
-
         return ClusterSerializer.to_dict(self)
@@ -131,17 +131,18 @@ class FeatureParser:
         otherwise_conform = feature_elem.find("otherwiseConform")
 
         if mandatory_conform is not None:
-            feature_obj.conformance = parse_conformance(
-                mandatory_conform, self.feature_map)
+            feature_obj.set_conformance(
+                parse_conformance(mandatory_conform, self.feature_map))
         elif optional_conform is not None:
-            feature_obj.conformance = parse_conformance(
-                optional_conform, self.feature_map)
+            feature_obj.set_conformance(
+                parse_conformance(optional_conform, self.feature_map))
         elif disallowed_conform is not None:
             # Feature with disallowed conformance should be removed
             return True
         elif otherwise_conform is not None:
-            feature_obj.conformance = parse_otherwise_conformance(
-                otherwise_conform, self.feature_map)
+            feature_obj.set_conformance(
+                parse_otherwise_conformance(otherwise_conform,
+                                            self.feature_map))
 
         return False
 
@@ -173,7 +174,7 @@ class FeatureParser:
         # Add base features to the cluster if they are not already in the cluster
         if base_features:
             for base_feature in base_features:
-                if base_feature.code not in self.feature_map.keys():
+                if base_feature.code not in self.feature_map:
                     self.cluster.features.add(base_feature)
 
     def _process_feature(self,
@@ -187,22 +188,23 @@ class FeatureParser:
         :returns: None
 
         """
+        # The matches are collected in sets, so the cluster containers are scanned as is instead of sorted for every feature
         # Match attributes to features
         feature_attribute_list = self._match_attribute_features(
-            feature_obj.code, self.cluster.get_attribute_list())
+            feature_obj.code, self.cluster.attributes)
         if feature_attribute_list:
             feature_obj.add_attribute_list(feature_attribute_list)
 
         # Match commands to features
         feature_command_list = self._match_command_features(
-            feature_obj.code, self.cluster.get_command_list())
+            feature_obj.code, self.cluster.commands)
 
         if feature_command_list:
             feature_obj.add_command_list(feature_command_list)
 
         # Match events to features
         feature_event_list = self._match_event_features(
-            feature_obj.code, self.cluster.get_event_list())
+            feature_obj.code, self.cluster.events)
         if feature_event_list:
             feature_obj.add_event_list(feature_event_list)
 
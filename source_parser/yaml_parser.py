@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from functools import lru_cache
+
 from utils.file_utils import load_yaml_file
 from utils.helper import esp_name
 from utils.logger import setup_logger
@@ -29,6 +31,8 @@ class YamlParser:
                 f"Could not load YAML configuration from {file_path}, using empty config"
             )
             self.config = {}
+        # esp names of the items of each list looked up with is_present_in_list(), built on first use
+        self._name_sets = {}
 
     def is_present(self, key: str) -> bool:
         """Check if a key exists in the YAML configuration
@@ -61,8 +65,22 @@ class YamlParser:
         :returns: True if the value exists in the list, False otherwise.
 
         """
-        if self.is_present(key):
-            return any(
-                esp_name(value) == esp_name(item)
-                for item in self.get_list(key))
-        return False
+        if not self.is_present(key):
+            return False
+        name_set = self._name_sets.get(key)
+        if name_set is None:
+            name_set = frozenset(
+                esp_name(item) for item in self.get_list(key) or ())
+            self._name_sets[key] = name_set
+        return esp_name(value) in name_set
+
+
+@lru_cache(maxsize=None)
+def get_yaml_parser(file_path: str) -> YamlParser:
+    """Get a YamlParser for a YAML file, the file is loaded only once per process
+
+    :param file_path: str:
+    :returns: The YamlParser of the file.
+
+    """
+    return YamlParser(file_path)
@@ -11,6 +11,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from source_parser.cluster_parser import ClusterParser
 from utils.file_utils import create_output_directory
 from utils.file_utils import validate_directory_path
 from utils.file_utils import validate_file_path
@@ -129,6 +130,140 @@ class TestLogging(unittest.TestCase):
         self.assertEqual(logger.name, "matter_json_generator")
 
 
+class TestClusterParsing(unittest.TestCase):
+    """Test cluster XML parsing."""
+
+    BASE_CLUSTER_XML = """<cluster xmlns="" id="0x0050" name="Mode Base" revision="2">
+  <classification hierarchy="base" role="application" picsCode="MODB" scope="Endpoint"/>
+  <commands>
+    <command id="0x00" name="ChangeToMode" direction="commandToServer"
+             response="ChangeToModeResponse">
+      <access invokePrivilege="operate"/>
+      <mandatoryConform/>
+    </command>
+  </commands>
+</cluster>
+"""
+
+    DERIVED_CLASSIFICATION_XML = (
+        '<classification hierarchy="derived" baseCluster="Mode Base" '
+        'role="application" picsCode="DISHM" scope="Endpoint"/>')
+
+    DERIVED_CLUSTER_XML = f"""<cluster xmlns="" id="0x0059" name="Dishwasher Mode" revision="2">
+  <clusterIds>
+    <clusterId id="0x0059" name="Dishwasher Mode"/>
+  </clusterIds>
+  {DERIVED_CLASSIFICATION_XML}
+  <commands>
+    <command id="0x00" name="ChangeToMode">
+      <mandatoryConform/>
+    </command>
+  </commands>
+</cluster>
+"""
+
+    BASE_DATA_TYPES_XML = """  <dataTypes>
+    <enum name="ModeTagEnum">
+      <item value="0" name="Auto" summary="The mode is automatic"/>
+    </enum>
+    <bitmap name="ModeOptionBitmap">
+      <bitfield name="Quick" bit="0" summary="The mode is quick"/>
+    </bitmap>
+  </dataTypes>
+"""
+
+    DERIVED_ATTRIBUTES_XML = """  <attributes>
+    <attribute id="0x0000" name="CurrentTag" type="ModeTagEnum">
+      <mandatoryConform/>
+    </attribute>
+    <attribute id="0x0001" name="Options" type="ModeOptionBitmap">
+      <mandatoryConform/>
+    </attribute>
+  </attributes>
+"""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_file(self, name, content):
+        """Write a file to the temporary directory and return its path."""
+        file_path = os.path.join(self.temp_dir, name)
+        with open(file_path, "w") as f:
+            f.write(content)
+        return file_path
+
+    def test_derived_cluster_keeps_inherited_command(self):
+        """Test that a derived cluster keeps a base command it redefines."""
+        base_file = self._write_file("ModeBase.xml", self.BASE_CLUSTER_XML)
+        derived_file = self._write_file("Mode_Dishwasher.xml",
+                                        self.DERIVED_CLUSTER_XML)
+        yaml_file = os.path.join(self.temp_dir, "config.yaml")
+
+        base_clusters = ClusterParser().parse_cluster_file(
+            base_file, yaml_file)
+        derived_clusters = ClusterParser().parse_cluster_file(
+            derived_file, yaml_file, base_clusters)
+
+        self.assertEqual(len(derived_clusters), 1)
+        commands = derived_clusters[0].get_command_list()
+        self.assertEqual([command.name for command in commands],
+                         ["change_to_mode", "change_to_mode"])
+        self.assertEqual(
+            sorted(str(command.direction) for command in commands),
+            ["None", "commandToServer"])
+
+    def test_derived_cluster_uses_base_data_types(self):
+        """Test that a derived cluster resolves data types of its base cluster file."""
+        base_file = self._write_file(
+            "ModeBase.xml",
+            self.BASE_CLUSTER_XML.replace(
+                "  <commands>", self.BASE_DATA_TYPES_XML + "  <commands>"))
+        derived_file = self._write_file(
+            "Mode_Dishwasher.xml",
+            self.DERIVED_CLUSTER_XML.replace(
+                "  <commands>", self.DERIVED_ATTRIBUTES_XML + "  <commands>"))
+        yaml_file = os.path.join(self.temp_dir, "config.yaml")
+
+        base_clusters = ClusterParser().parse_cluster_file(
+            base_file, yaml_file)
+        derived_clusters = ClusterParser().parse_cluster_file(
+            derived_file, yaml_file, base_clusters)
+
+        self.assertEqual(len(derived_clusters), 1)
+        attribute_types = {
+            attribute.name: attribute.type
+            for attribute in derived_clusters[0].get_attribute_list()
+        }
+        self.assertEqual(attribute_types.get("current_tag"), "enum8")
+        self.assertEqual(attribute_types.get("options"), "bitmap8")
+
+    def test_derived_cluster_without_classification(self):
+        """Test that a cluster parsed as derived without a classification gets no base cluster."""
+        base_file = self._write_file("ModeBase.xml", self.BASE_CLUSTER_XML)
+        derived_file = self._write_file(
+            "Mode_Dishwasher.xml",
+            self.DERIVED_CLUSTER_XML.replace(self.DERIVED_CLASSIFICATION_XML,
+                                             ""))
+        yaml_file = os.path.join(self.temp_dir, "config.yaml")
+
+        base_clusters = ClusterParser().parse_cluster_file(
+            base_file, yaml_file)
+        derived_clusters = ClusterParser().parse_cluster_file(
+            derived_file, yaml_file, base_clusters)
+
+        self.assertEqual(len(derived_clusters), 1)
+        self.assertEqual(
+            [command.name for command in derived_clusters[0].get_command_list()],
+            ["change_to_mode"])
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests for core functionality."""
 
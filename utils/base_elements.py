@@ -21,7 +21,7 @@ from utils.mapping import *
 
 def get_id_name_lambda():
     """ """
-    return lambda x: (int(x.get_id(), 16), x.name)
+    return lambda x: (x.id_int, x.name)
 
 
 def modify_id(id):
@@ -40,10 +40,14 @@ def modify_id(id):
 class BaseElement:
     """ """
 
+    __slots__ = ("name", "id", "id_int", "esp_name", "chip_name", "func_name")
+
     def __init__(self, name, id):
         assert name, "Name is required"
         self.name = convert_to_snake_case(name)
         self.id = modify_id(id)
+        # Integer value of the id, parsed once as it is the sort key of every element list
+        self.id_int = int(self.id, 16)
         self.esp_name = esp_name(name)
         self.chip_name = chip_name(name)
         self.func_name = convert_to_snake_case(name)
@@ -56,6 +60,8 @@ class BaseElement:
 class BaseClusterElement(BaseElement):
     """ """
 
+    __slots__ = ("is_mandatory", )
+
     def __init__(self, name, id, is_mandatory):
         if name and name in cpp_reserved_words or name.lower(
         ) in cpp_reserved_words:
@@ -69,6 +75,22 @@ class BaseClusterElement(BaseElement):
 class BaseCluster(BaseClusterElement):
     """ """
 
+    __slots__ = (
+        "revision",
+        "server_cluster",
+        "client_cluster",
+        "command_handler_available",
+        "init_function_available",
+        "attribute_changed_function_available",
+        "shutdown_function_available",
+        "pre_attribute_change_function_available",
+        "delegate_init_callback_available",
+        "plugin_init_cb_available",
+        "delegate_init_callback",
+        "plugin_server_init_callback",
+        "role",
+    )
+
     def __init__(self, name, id, revision, is_mandatory):
         super().__init__(name=name, id=id, is_mandatory=is_mandatory)
         self.revision = revision
@@ -127,6 +149,8 @@ class BaseAttribute(BaseClusterElement):
 class BaseCommand(BaseClusterElement):
     """ """
 
+    __slots__ = ("direction", "response")
+
     def __init__(self, name, id, is_mandatory, direction, response):
         if name and name in cpp_reserved_words or name.lower(
         ) in cpp_reserved_words:
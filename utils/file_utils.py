@@ -19,6 +19,13 @@ except ImportError:
     logger.warning(
         "PyYAML not available. YAML file operations will be disabled.")
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def create_dir(dir_path: str) -> bool:
     """Create a directory if it does not exist
@@ -106,11 +113,15 @@ def list_directory(dir_path: str) -> Optional[List[str]]:
 
 def load_json_file(file_path: str) -> Optional[Dict[str, Any]]:
     """Load and parse a JSON file with error handling
+    orjson is used for parsing if it is installed, otherwise the standard json module.
 
     :param file_path: str:
 
     """
     try:
+        if ORJSON_AVAILABLE:
+            with open(file_path, "rb") as f:
+                return orjson.loads(f.read())
         with open(file_path, "r", encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError:
@@ -133,6 +144,8 @@ def load_json_file(file_path: str) -> Optional[Dict[str, Any]]:
 
 def write_to_json_file(file_path: str, data: Any) -> bool:
     """Write data to a JSON file
+    orjson is used for serialization if it is installed, otherwise the standard json module.
+    Both produce the same JSON indented with 2 spaces.
 
     :param file_path: Path to the file where the data will be written.
     :param data: Data to be written to the JSON file
@@ -147,8 +160,15 @@ def write_to_json_file(file_path: str, data: Any) -> bool:
         if parent_dir and not create_dir(parent_dir):
             return False
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        if ORJSON_AVAILABLE:
+            with open(file_path, "wb") as f:
+                f.write(
+                    orjson.dumps(data,
+                                 option=orjson.OPT_INDENT_2
+                                 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         return True
     except FileNotFoundError as e:
         logger.error(f"Directory not found for file {file_path}: {str(e)}")
@@ -191,19 +211,27 @@ def create_output_directory(output_dir: str) -> bool:
 
 def get_file_list_by_extension(dir_path: str, extension: str) -> List[str]:
     """Get list of files with specific extension from directory
+    os.scandir is used so that the file type comes from the directory entry without an extra stat call per file.
 
     :param dir_path: str:
     :param extension: str:
 
     """
-    file_list = list_directory(dir_path)
-    if file_list is None:
+    try:
+        with os.scandir(dir_path) as entries:
+            return [
+                entry.path for entry in entries
+                if entry.name.endswith(extension) and entry.is_file()
+            ]
+    except FileNotFoundError:
+        logger.error(f"Directory not found: {dir_path}")
+        return []
+    except PermissionError:
+        logger.error(f"Permission denied accessing directory: {dir_path}")
+        return []
+    except OSError as e:
+        logger.error(f"OS error accessing directory {dir_path}: {str(e)}")
         return []
-
-    return [
-        os.path.join(dir_path, file_name) for file_name in file_list
-        if file_name.endswith(extension)
-    ]
 
 
 def validate_input_paths(*paths: str) -> bool:
@@ -13,12 +13,22 @@
 # limitations under the License.
 import json
 import re
+from functools import lru_cache
 
 from utils.file_utils import write_to_json_file
 # Import file utilities
 
 # Helper functions
 
+# Regular expressions of the name conversions, compiled once as the helpers run for every element
+_CHIP_NAME_SEPARATOR_RE = re.compile(r"[^a-zA-Z0-9]")
+_ESP_NAME_SEPARATOR_RE = re.compile(r"[^a-zA-Z0-9_]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SNAKE_SEPARATOR_RE = re.compile(r"[\/_|\{\}\(\)\\-]")
+_ACRONYM_BOUNDARY_RE = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_LETTER_DIGIT_BOUNDARY_RE = re.compile(r"([a-zA-Z])([0-9])")
+_LOWER_UPPER_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+
 
 def chip_name(name):
     """Convert a name to as per the chip naming convention e.g. On/Off -> OnOff
@@ -26,34 +36,38 @@ def chip_name(name):
     :param name:
 
     """
-    name = re.sub(r"[^a-zA-Z0-9]", " ", name)
+    name = _CHIP_NAME_SEPARATOR_RE.sub(" ", name)
     words = [word.capitalize() for word in name.split()]
     return "".join(words)
 
 
+@lru_cache(maxsize=4096)
 def esp_name(name):
     """Convert a name to as per the esp matter naming convention e.g. On/Off -> on_off
+    The result is cached as the same names are converted for every cluster and device type.
 
     :param name:
 
     """
-    name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
+    name = _ESP_NAME_SEPARATOR_RE.sub("_", name)
     return name.lower()
 
 
+@lru_cache(maxsize=4096)
 def convert_to_snake_case(name):
     """Convert a name to snake_case. PM2.5 Concentration Measurement -> pm2_5_concentration_measurement
+    The result is cached as the same feature and command names repeat across clusters and conformances.
 
     :param name:
 
     """
     if name.endswith("Command"):
         name = name[:-7].replace(" ", "_")
-    name = re.sub(r"\s+", "_", name)
-    name = re.sub(r"[\/_|\{\}\(\)\\-]", "_", name)
-    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
-    name = re.sub(r"([a-zA-Z])([0-9])", r"\1_\2", name)
-    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    name = _WHITESPACE_RE.sub("_", name)
+    name = _SNAKE_SEPARATOR_RE.sub("_", name)
+    name = _ACRONYM_BOUNDARY_RE.sub(r"\1_\2", name)
+    name = _LETTER_DIGIT_BOUNDARY_RE.sub(r"\1_\2", name)
+    name = _LOWER_UPPER_BOUNDARY_RE.sub(r"\1_\2", name)
     return name.lower()
 
 
@@ -63,15 +77,10 @@ def check_valid_id(id):
     :param id:
 
     """
-    if id is None or id == "":
-        return False
-    elif not id.startswith("0x"):
-        return False
-    elif not is_hex_value(id):
-        return False
-    if id in ["ID-TBD"]:
+    # Placeholder ids such as "ID-TBD" fail the prefix check
+    if not id or not id.startswith("0x"):
         return False
-    return True
+    return is_hex_value(id)
 
 
 def safe_get_attr(obj, attr_name, default=None):
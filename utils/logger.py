@@ -50,6 +50,11 @@ class ColoredFormatter(logging.Formatter):
             Colors.RED + Colors.BOLD +
             "CRITICAL: %(pathname)s: %(lineno)d: %(message)s" + Colors.ENDC,
         }
+        # Formatters are created once per level instead of once per record
+        self.formatters = {
+            level: logging.Formatter(log_fmt)
+            for level, log_fmt in self.FORMATS.items()
+        }
 
     def format(self, record):
         """
@@ -59,8 +64,9 @@ class ColoredFormatter(logging.Formatter):
         """
         # Get the relative path instead of full path
         record.pathname = os.path.relpath(record.pathname)
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
+        formatter = self.formatters.get(record.levelno)
+        if formatter is None:
+            formatter = logging.Formatter(self.FORMATS.get(record.levelno))
         return formatter.format(record)
 
 
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # These are the clusters generated from single cluster file with multiple cluster ids hence it's commands will not be having any callbacks
-command_callback_skip_list = [
+command_callback_skip_list = frozenset([
     "joint_fabric_datastore",
     "joint_fabric_pki",
     "energy_price",
@@ -43,7 +43,7 @@ command_callback_skip_list = [
     "bridged_device_basic_information",
     "alarm_base",
     "mode_base",
-]
+])
 
 # Cluster names are mapped to work with the existing code
 cluster_name_mapping = {
@@ -121,3 +121,9 @@ cpp_reserved_words = [
 callback_skip_list = [
     "MoveToClosestFrequency",
 ]
+
+# File name (without extension) patterns of cluster XML files known to contain only derived clusters e.g. Mode_Dishwasher.xml
+# Matching files are classified as derived without reading them, all other files are checked for their classification hierarchy
+cluster_hierarchy_hints = [
+    r"^Mode_(?!Base$|Select$)\w+$",
+]
@@ -0,0 +1,82 @@
+# Copyright 2025 Mahesh Pimpale
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+from lxml import etree as ET
+
+# lxml parsers must not be used by several threads at once, so every thread gets its own shared parser
+_thread_local = threading.local()
+
+
+def create_xml_parser():
+    """Create an lxml parser configured for the Matter data model XML files.
+    Comments and processing instructions are dropped so that iterating over the children of an element only yields elements,
+    the same as with xml.etree.ElementTree.
+    The data model files do not use xml:id attributes, ignorable whitespace or entities, so ID collection, blank text
+    nodes and entity resolution are disabled, and huge_tree lifts the libxml2 limits on very large files.
+
+    :returns: An lxml XMLParser instance.
+
+    """
+    return ET.XMLParser(
+        remove_comments=True,
+        remove_pis=True,
+        collect_ids=False,
+        remove_blank_text=True,
+        huge_tree=True,
+        resolve_entities=False,
+    )
+
+
+def get_shared_xml_parser():
+    """Get the XML parser shared by all the files parsed in the current thread.
+    This avoids setting up a new parser for every file.
+
+    :returns: An lxml XMLParser instance.
+
+    """
+    parser = getattr(_thread_local, "parser", None)
+    if parser is None:
+        parser = create_xml_parser()
+        _thread_local.parser = parser
+    return parser
+
+
+def parse_xml_file(file_path, parser=None):
+    """Parse an XML file and return its root element.
+    The file is opened here so that missing or unreadable files raise FileNotFoundError/PermissionError as with the stdlib parser.
+
+    :param file_path: Path to the XML file.
+    :param parser: lxml XMLParser to use, the shared parser of the current thread if None.  (Default value = None)
+    :returns: The root element of the XML file.
+    :raises ET.ParseError: If the XML is malformed.
+
+    """
+    if parser is None:
+        parser = get_shared_xml_parser()
+    with open(file_path, "rb") as f:
+        return ET.parse(f, parser).getroot()
+
+
+def find_first(xpath, element):
+    """Get the first element matched by a precompiled XPath expression, the equivalent of element.find().
+    Evaluating an ET.XPath object compiled once is faster than element.find() with a path string for repeated lookups.
+
+    :param xpath: Precompiled ET.XPath expression.
+    :param element: The element to evaluate the expression on.
+    :returns: The first matching element, None if there is none.
+
+    """
+    result = xpath(element)
+    return result[0] if result else None